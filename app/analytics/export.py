@@ -0,0 +1,47 @@
+# app/analytics/export.py
+import csv
+import io
+import json
+from datetime import datetime
+from typing import AsyncIterator, Literal, Sequence
+from uuid import UUID
+
+from sqlalchemy import Select
+
+from app.db.session import AsyncSessionLocal
+
+ExportFormat = Literal["csv", "ndjson"]
+
+EXPORT_CHUNK_SIZE = 2000
+MEDIA_TYPES = {"csv": "text/csv; charset=utf-8", "ndjson": "application/x-ndjson"}
+
+
+def _json_default(value):
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, UUID):
+        return str(value)
+    raise TypeError(f"Cannot serialize {type(value).__name__}")
+
+
+def encode_chunk(columns: Sequence[str], rows: Sequence[Sequence], fmt: ExportFormat) -> str:
+    if fmt == "ndjson":
+        return "".join(json.dumps(dict(zip(columns, row)), default=_json_default, ensure_ascii=False) + "\n" for row in rows)
+    buffer = io.StringIO()
+    csv.writer(buffer).writerows(rows)
+    return buffer.getvalue()
+
+
+async def stream_export(query: Select, fmt: ExportFormat) -> AsyncIterator[str]:
+    """Yield `query` encoded as CSV/NDJSON, one chunk of rows at a time.
+
+    Reads through a server-side cursor on its own session, so memory is bounded by
+    EXPORT_CHUNK_SIZE however many rows match and the request's session can be released.
+    """
+    columns = [column.name for column in query.selected_columns]
+    if fmt == "csv":
+        yield encode_chunk(columns, [columns], fmt)
+    async with AsyncSessionLocal() as db:
+        result = await db.stream(query.execution_options(yield_per=EXPORT_CHUNK_SIZE))
+        async for chunk in result.partitions(EXPORT_CHUNK_SIZE):
+            yield encode_chunk(columns, chunk, fmt)
@@ -0,0 +1,133 @@
+# app/analytics/keywords.py
+import asyncio
+import multiprocessing
+import re
+import time
+from collections import Counter, OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterable, Iterator
+from uuid import UUID
+
+from sqlalchemy import select
+
+from app.core.config import settings
+from app.db.session import AsyncSessionLocal
+from app.models.feedback import Feedback
+
+TOKEN_PATTERN = re.compile(r"\b[a-zA-Z]{4,}\b")
+RECOMPUTE_CHUNK_SIZE = 2000
+
+
+def tokenize(text: str, stop_words: frozenset[str] | set[str]) -> Iterator[str]:
+    for match in TOKEN_PATTERN.finditer(text.lower()):
+        word = match.group()
+        if word not in stop_words:
+            yield word
+
+
+def count_keywords(comments: list[str], stop_words: frozenset[str], limit: int) -> list[tuple[str, int]]:
+    # Runs in the worker pool; returns a bounded summary so merging stays cheap on the event loop
+    counts = Counter()
+    for comment in comments:
+        counts.update(tokenize(comment, stop_words))
+    return counts.most_common(limit)
+
+
+class SpaceSaving:
+    """Bounded heavy-hitters counter (Metwally et al.): keeps at most `capacity` items, overestimating by at most the evicted minimum."""
+
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self.counts: dict[str, int] = {}
+
+    def add(self, item: str, count: int = 1) -> None:
+        if item in self.counts:
+            self.counts[item] += count
+        elif len(self.counts) < self.capacity:
+            self.counts[item] = count
+        else:
+            victim = min(self.counts, key=self.counts.__getitem__)
+            floor = self.counts.pop(victim)
+            self.counts[item] = floor + count
+
+    def update(self, items: Iterable[str]) -> None:
+        for item in items:
+            self.add(item)
+
+    def top(self, n: int) -> list[tuple[str, int]]:
+        return sorted(self.counts.items(), key=lambda kv: (-kv[1], kv[0]))[:n]
+
+
+class KeywordIndex:
+    """Per-event top-k keyword trackers, fed as feedback arrives and rebuilt from the database when stale."""
+
+    def __init__(self, capacity: int, ttl_seconds: int, workers: int, max_events: int = 1000):
+        self.capacity = capacity
+        self.ttl_seconds = ttl_seconds
+        self.workers = workers
+        self.max_events = max_events
+        self.stop_words = frozenset(w.lower() for w in settings.KEYWORD_STOP_WORDS)
+        self._trackers: OrderedDict[UUID, tuple[SpaceSaving, float]] = OrderedDict()
+        self._rebuilds: dict[UUID, asyncio.Task] = {}
+        self._pool: ProcessPoolExecutor | None = None
+
+    def _executor(self):
+        if self.workers <= 0:
+            return None
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(max_workers=self.workers, mp_context=multiprocessing.get_context("spawn"))
+        return self._pool
+
+    def observe(self, event_id: UUID, comment: str | None) -> None:
+        entry = self._trackers.get(event_id)
+        if entry is not None and comment:
+            entry[0].update(tokenize(comment, self.stop_words))
+
+    def discard(self, event_id: UUID) -> None:
+        self._trackers.pop(event_id, None)
+
+    async def top_keywords(self, event_id: UUID, n: int = 10) -> list[str]:
+        entry = self._trackers.get(event_id)
+        if entry is None or time.monotonic() - entry[1] > self.ttl_seconds:
+            # Concurrent summaries of the same event share one rebuild
+            task = self._rebuilds.get(event_id)
+            if task is None:
+                task = asyncio.ensure_future(self._rebuild(event_id))
+                self._rebuilds[event_id] = task
+                task.add_done_callback(lambda _: self._rebuilds.pop(event_id, None))
+            entry = await asyncio.shield(task)
+        self._trackers.move_to_end(event_id)
+        return [word for word, _ in entry[0].top(n)]
+
+    async def _rebuild(self, event_id: UUID) -> tuple[SpaceSaving, float]:
+        # Own session: the rebuild is shared and may outlive the request that started it
+        loop = asyncio.get_running_loop()
+        tracker = SpaceSaving(self.capacity)
+        async with AsyncSessionLocal() as db:
+            comments = await db.stream_scalars(
+                select(Feedback.comment)
+                .where(Feedback.event_id == event_id, Feedback.comment.isnot(None), Feedback.comment != "")
+                .execution_options(yield_per=RECOMPUTE_CHUNK_SIZE)
+            )
+            async for chunk in comments.partitions(RECOMPUTE_CHUNK_SIZE):
+                summary = await loop.run_in_executor(self._executor(), count_keywords, list(chunk), self.stop_words, self.capacity)
+                for word, count in summary:
+                    tracker.add(word, count)
+
+        entry = (tracker, time.monotonic())
+        self._trackers[event_id] = entry
+        while len(self._trackers) > self.max_events:
+            self._trackers.popitem(last=False)
+        return entry
+
+    def shutdown(self) -> None:
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+
+
+keyword_index = KeywordIndex(
+    capacity=settings.KEYWORD_TOP_K_CAPACITY,
+    ttl_seconds=settings.KEYWORD_TRACKER_TTL_SECONDS,
+    workers=settings.KEYWORD_WORKERS,
+)
@@ -0,0 +1,246 @@
+# app/analytics/rollups.py
+import uuid
+from collections import Counter
+from datetime import datetime
+from uuid import UUID
+
+from sqlalchemy import delete, func, literal_column, select, text, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.event import Event
+from app.models.event_stats import EventEmojiCount, EventFeedbackMinute, EventStats
+from app.models.feedback import Feedback
+from app.models.rsvp import RSVP
+
+# The record_* helpers only stage upserts on the caller's session, so the rollups
+# commit (or roll back) together with the RSVP/feedback change they describe.
+
+
+def minute_bucket(timestamp: datetime) -> datetime:
+    return timestamp.replace(second=0, microsecond=0)
+
+
+async def _bump_stats(
+    db: AsyncSession, event_id: UUID, rsvps: int = 0, checkins: int = 0, feedback: int = 0, moderations: int = 0
+) -> None:
+    stmt = insert(EventStats).values(
+        event_id=event_id, rsvp_count=rsvps, checkin_count=checkins, feedback_count=feedback, moderation_count=moderations
+    )
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[EventStats.event_id],
+        set_={
+            "rsvp_count": EventStats.rsvp_count + stmt.excluded.rsvp_count,
+            "checkin_count": EventStats.checkin_count + stmt.excluded.checkin_count,
+            "feedback_count": EventStats.feedback_count + stmt.excluded.feedback_count,
+            "moderation_count": EventStats.moderation_count + stmt.excluded.moderation_count,
+        },
+    )
+    await db.execute(stmt)
+
+
+async def ensure_stats(db: AsyncSession, event_id: UUID) -> None:
+    await db.execute(insert(EventStats).values(event_id=event_id).on_conflict_do_nothing())
+
+
+async def record_rsvp(db: AsyncSession, event_id: UUID, checked_in: bool = False) -> None:
+    await _bump_stats(db, event_id, rsvps=1, checkins=int(checked_in))
+
+
+# One statement: claim a seat on the event_stats counter and insert the RSVP, or do neither.
+# The UPDATE re-checks rsvp_count < max_attendees against the latest committed row, so
+# concurrent requests queue on that single row instead of locking any table.
+RESERVE_RSVP_SQL = text("""
+WITH capacity AS (
+    SELECT s.rsvp_count, e.max_attendees
+    FROM event_stats s JOIN events e ON e.id = s.event_id
+    WHERE s.event_id = :event_id
+),
+ins AS (
+    INSERT INTO rsvps (id, event_id, user_id)
+    SELECT :rsvp_id, :event_id, :user_id
+    FROM capacity
+    WHERE capacity.rsvp_count < capacity.max_attendees
+    ON CONFLICT (event_id, user_id) DO NOTHING
+    RETURNING id
+),
+slot AS (
+    UPDATE event_stats SET rsvp_count = event_stats.rsvp_count + 1
+    FROM events
+    WHERE event_stats.event_id = :event_id
+      AND events.id = event_stats.event_id
+      AND EXISTS (SELECT 1 FROM ins)
+      AND event_stats.rsvp_count < events.max_attendees
+    RETURNING event_stats.rsvp_count
+)
+SELECT
+    EXISTS (SELECT 1 FROM ins) AS inserted,
+    EXISTS (SELECT 1 FROM slot) AS reserved,
+    EXISTS (SELECT 1 FROM rsvps WHERE event_id = :event_id AND user_id = :user_id) AS existing,
+    (SELECT rsvp_count FROM capacity) AS rsvp_count,
+    (SELECT max_attendees FROM capacity) AS max_attendees
+""")
+
+
+async def reserve_rsvp(db: AsyncSession, event_id: UUID, user_id: UUID) -> str:
+    """Atomically RSVP `user_id` to `event_id`. Commits or rolls back.
+
+    Returns "confirmed", "duplicate" or "full".
+    """
+    for _ in range(2):
+        params = {"rsvp_id": uuid.uuid4(), "event_id": event_id, "user_id": user_id}
+        outcome = (await db.execute(RESERVE_RSVP_SQL, params)).one()
+        if outcome.inserted and outcome.reserved:
+            await db.commit()
+            return "confirmed"
+        # Inserted but lost the last seat to a concurrent RSVP: undo the insert
+        await db.rollback()
+        if outcome.inserted:
+            return "full"
+        if outcome.rsvp_count is None:
+            # Event predates the rollups; seed its counter and try once more
+            await rebuild(db, event_id)
+            continue
+        if outcome.existing or outcome.rsvp_count < outcome.max_attendees:
+            # Under capacity yet nothing inserted means ON CONFLICT hit a concurrent duplicate
+            return "duplicate"
+        return "full"
+    return "full"
+
+
+async def record_checkin(db: AsyncSession, event_id: UUID) -> None:
+    await _bump_stats(db, event_id, checkins=1)
+
+
+async def record_walkins(db: AsyncSession, event_id: UUID, rsvps: int, checkins: int) -> None:
+    await _bump_stats(db, event_id, rsvps=rsvps, checkins=checkins)
+
+
+async def record_moderation(db: AsyncSession, event_id: UUID) -> None:
+    await _bump_stats(db, event_id, moderations=1)
+
+
+async def record_feedback(db: AsyncSession, event_id: UUID, emoji: str, timestamp: datetime) -> None:
+    await record_feedback_batch(db, [(event_id, emoji, timestamp)])
+
+
+async def record_feedback_batch(db: AsyncSession, rows: list[tuple[UUID, str, datetime]]) -> None:
+    """Fold (event_id, emoji, timestamp) rows into one multi-row upsert per rollup table."""
+    per_event, per_emoji, per_minute = Counter(), Counter(), Counter()
+    for event_id, emoji, timestamp in rows:
+        per_event[event_id] += 1
+        per_emoji[(event_id, emoji)] += 1
+        per_minute[(event_id, minute_bucket(timestamp))] += 1
+
+    # Sorted so concurrent writers lock rows in the same order; event_stats first so its
+    # row lock also orders writers against rebuild()
+    stats_stmt = insert(EventStats).values([
+        {"event_id": event_id, "rsvp_count": 0, "checkin_count": 0, "feedback_count": count, "moderation_count": 0}
+        for event_id, count in sorted(per_event.items())
+    ])
+    await db.execute(stats_stmt.on_conflict_do_update(
+        index_elements=[EventStats.event_id],
+        set_={"feedback_count": EventStats.feedback_count + stats_stmt.excluded.feedback_count},
+    ))
+
+    emoji_stmt = insert(EventEmojiCount).values([
+        {"event_id": event_id, "emoji": emoji, "count": count}
+        for (event_id, emoji), count in sorted(per_emoji.items())
+    ])
+    await db.execute(emoji_stmt.on_conflict_do_update(
+        index_elements=[EventEmojiCount.event_id, EventEmojiCount.emoji],
+        set_={"count": EventEmojiCount.count + emoji_stmt.excluded.count},
+    ))
+
+    minute_stmt = insert(EventFeedbackMinute).values([
+        {"event_id": event_id, "minute": minute, "count": count}
+        for (event_id, minute), count in sorted(per_minute.items())
+    ])
+    await db.execute(minute_stmt.on_conflict_do_update(
+        index_elements=[EventFeedbackMinute.event_id, EventFeedbackMinute.minute],
+        set_={"count": EventFeedbackMinute.count + minute_stmt.excluded.count},
+    ))
+
+
+async def get_stats(db: AsyncSession, event_id: UUID) -> EventStats | None:
+    result = await db.execute(select(EventStats).where(EventStats.event_id == event_id))
+    return result.scalar_one_or_none()
+
+
+async def feedback_version(db: AsyncSession, event_id: UUID) -> tuple[int, int]:
+    """(feedback_count, moderation_count): changes whenever the event's feedback list does."""
+    result = await db.execute(
+        select(EventStats.feedback_count, EventStats.moderation_count).where(EventStats.event_id == event_id)
+    )
+    row = result.one_or_none()
+    return (row.feedback_count, row.moderation_count) if row else (0, 0)
+
+
+async def get_stats_for(db: AsyncSession, event_ids: list[UUID]) -> dict[UUID, EventStats]:
+    if not event_ids:
+        return {}
+    result = await db.execute(select(EventStats).where(EventStats.event_id.in_(event_ids)))
+    return {stats.event_id: stats for stats in result.scalars().all()}
+
+
+async def top_emojis(db: AsyncSession, event_id: UUID, limit: int = 3) -> list[tuple[str, int]]:
+    result = await db.execute(
+        select(EventEmojiCount.emoji, EventEmojiCount.count)
+        .where(EventEmojiCount.event_id == event_id)
+        .order_by(EventEmojiCount.count.desc(), EventEmojiCount.emoji)
+        .limit(limit)
+    )
+    return [(emoji, count) for emoji, count in result.all()]
+
+
+async def feedback_volume(db: AsyncSession, event_id: UUID) -> list[tuple[str, int]]:
+    result = await db.execute(
+        select(EventFeedbackMinute.minute, EventFeedbackMinute.count)
+        .where(EventFeedbackMinute.event_id == event_id)
+        .order_by(EventFeedbackMinute.minute)
+    )
+    return [(minute.strftime("%Y-%m-%d %H:%M"), count) for minute, count in result.all()]
+
+
+async def rebuild(db: AsyncSession, event_id: UUID) -> None:
+    """Recompute one event's rollups from rsvps/feedback. Commits."""
+    await ensure_stats(db, event_id)
+    # Holding the stats row blocks concurrent record_* calls for this event until we commit
+    await db.execute(select(EventStats.event_id).where(EventStats.event_id == event_id).with_for_update())
+
+    rsvp_counts = await db.execute(
+        select(func.count(), func.count().filter(RSVP.check_in_time.isnot(None))).where(RSVP.event_id == event_id)
+    )
+    rsvp_count, checkin_count = rsvp_counts.one()
+    feedback_count = await db.scalar(select(func.count()).select_from(Feedback).where(Feedback.event_id == event_id))
+    await db.execute(
+        update(EventStats)
+        .where(EventStats.event_id == event_id)
+        .values(rsvp_count=rsvp_count, checkin_count=checkin_count, feedback_count=feedback_count)
+    )
+
+    await db.execute(delete(EventEmojiCount).where(EventEmojiCount.event_id == event_id))
+    await db.execute(insert(EventEmojiCount).from_select(
+        ["event_id", "emoji", "count"],
+        select(Feedback.event_id, Feedback.emoji, func.count())
+        .where(Feedback.event_id == event_id)
+        .group_by(Feedback.event_id, Feedback.emoji),
+    ))
+
+    minute = func.date_trunc(literal_column("'minute'"), Feedback.timestamp)
+    await db.execute(delete(EventFeedbackMinute).where(EventFeedbackMinute.event_id == event_id))
+    await db.execute(insert(EventFeedbackMinute).from_select(
+        ["event_id", "minute", "count"],
+        select(Feedback.event_id, minute, func.count())
+        .where(Feedback.event_id == event_id)
+        .group_by(Feedback.event_id, minute),
+    ))
+
+    await db.commit()
+
+
+async def rebuild_all(db: AsyncSession) -> int:
+    event_ids = (await db.execute(select(Event.id))).scalars().all()
+    for event_id in event_ids:
+        await rebuild(db, event_id)
+    return len(event_ids)
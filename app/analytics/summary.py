@@ -0,0 +1,60 @@
+# app/analytics/summary.py
+from datetime import datetime
+from uuid import UUID
+
+from sqlalchemy import delete, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.analytics import rollups
+from app.analytics.keywords import keyword_index
+from app.models.event import Event
+from app.models.event_stats import EventStats
+from app.models.event_summary import EventSummarySnapshot
+
+
+async def compute_summary(db: AsyncSession, event_id: UUID, stats: EventStats | None = None) -> dict:
+    """Everything summary.html shows, as JSON-friendly values."""
+    if stats is None:
+        stats = await rollups.get_stats(db, event_id)
+    return {
+        "total_rsvps": stats.rsvp_count if stats else 0,
+        "total_checkins": stats.checkin_count if stats else 0,
+        "total_feedback": stats.feedback_count if stats else 0,
+        "feedback_volume": await rollups.feedback_volume(db, event_id),
+        "top_emojis": await rollups.top_emojis(db, event_id),
+        "keywords": await keyword_index.top_keywords(event_id),
+    }
+
+
+async def get_snapshot(db: AsyncSession, event_id: UUID) -> EventSummarySnapshot | None:
+    return await db.get(EventSummarySnapshot, event_id)
+
+
+async def write_snapshot(db: AsyncSession, event_id: UUID) -> EventSummarySnapshot:
+    """Compute and store (or replace) the event's summary snapshot. Commits."""
+    data = await compute_summary(db, event_id)
+    stmt = insert(EventSummarySnapshot).values(event_id=event_id, generated_at=datetime.utcnow(), data=data)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[EventSummarySnapshot.event_id],
+        set_={"generated_at": stmt.excluded.generated_at, "data": stmt.excluded.data},
+    ).returning(EventSummarySnapshot)
+    snapshot = (await db.execute(stmt.execution_options(populate_existing=True))).scalar_one()
+    await db.commit()
+    return snapshot
+
+
+async def discard_snapshots(db: AsyncSession, event_ids) -> None:
+    """Drop stored snapshots for events that just received feedback, in the caller's transaction.
+
+    Only closed events have snapshots. Feedback that lands after close (queued on another worker
+    before it closed) makes the summary page compute a fresh one on the next visit.
+    """
+    await db.execute(delete(EventSummarySnapshot).where(EventSummarySnapshot.event_id.in_(set(event_ids))))
+
+
+async def regenerate_closed(db: AsyncSession) -> int:
+    event_ids = (await db.execute(select(Event.id).where(Event.status == "Closed"))).scalars().all()
+    for event_id in event_ids:
+        await write_snapshot(db, event_id)
+    return len(event_ids)
@@ -1,9 +1,8 @@
-from fastapi import APIRouter, Depends, Form, Request, Path, status, HTTPException
-from fastapi.responses import RedirectResponse, HTMLResponse, JSONResponse
-from fastapi.templating import Jinja2Templates
+from fastapi import APIRouter, Depends, Form, Request, Path, Query, Response, status, HTTPException
+from fastapi.responses import RedirectResponse, HTMLResponse, JSONResponse, StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
-from uuid import UUID
+from uuid import UUID, uuid4
 from datetime import datetime, date, timedelta
 
 from app.models.event import Event
@@ -11,12 +10,33 @@ from app.models.user import User
 from app.models.feedback import Feedback
 from app.schemas.feedback import FeedbackCreate
 import collections
-from sqlalchemy import func
+from sqlalchemy import func, literal_column, update
+from sqlalchemy.dialects.postgresql import insert
+import re
+from html import escape
+from urllib.parse import urlencode
 
 
+from app.db.routing import get_read_db
 from app.db.session import AsyncSessionLocal
 from app.users import current_active_user
+from app.users.db import get_user_db
+from app.live.broadcast import FeedbackMessage, feedback_broadcaster
+from app.live.notify import apply_message, feedback_notifier
+from app.live.watermarks import FeedbackCursor, feedback_watermarks
+from app.live.ingest import IngestQueueFull, PendingFeedback, announce_feedback, feedback_ingestor
+from app.analytics import rollups
+from app.analytics.export import MEDIA_TYPES, ExportFormat, stream_export
+from app.analytics import summary
+from app.analytics.keywords import keyword_index
+from app.core.calendar_cache import calendar_cache
+from app.core.etag import etag_matches, make_etag, not_modified, tag_response
+from app.core.event_cache import event_cache
+from app.core.pagination import EVENT_PAGE_MAX, EVENT_PAGE_SIZE, EventCursor, EventFilters, event_cursor, event_filters, host_events_page
+from app.core.ratelimit import rate_limit
+from app.core.templates import templates
 from collections import Counter
+import asyncio
 
 import httpx
 
@@ -25,12 +45,45 @@ from app.models.rsvp import RSVP
 
 
 router = APIRouter()
-templates = Jinja2Templates(directory="app/templates")
+
+SSE_KEEPALIVE_SECONDS = 15
+FEEDBACK_SNAPSHOT_SIZE = 10
+FEEDBACK_DELTA_LIMIT = 100
+FEEDBACK_POLL_INTERVAL = "30s"
+WALKIN_BULK_MAX_EMAILS = 5000
+EMAIL_SEPARATORS = re.compile(r"[\s,;]+")
 
 async def get_db() -> AsyncSession:
     async with AsyncSessionLocal() as session:
         yield session
 
+
+def _render_feedback_row(event_id, f, is_host: bool, oob: bool = False) -> str:
+    swap = " hx-swap-oob='true'" if oob else ""
+    row = f"<div id='feedback-{f.id}'{swap} class='border-b py-2 flex justify-between items-center'><div><strong>{f.emoji}</strong> {f.comment or ''}</div>"
+    if is_host:
+        actions = []
+        pin_label = "Unpin" if f.pinned else "Pin"
+        flag_label = "Unflag" if f.flagged else "Flag"
+        actions.append(f"<button hx-post='/events/{event_id}/feedback/{f.id}/pin' hx-target='#feedback-{f.id}' hx-swap='outerHTML' class='text-yellow-600 text-sm ml-2'>⭐ {pin_label}</button>")
+        actions.append(f"<button hx-post='/events/{event_id}/feedback/{f.id}/flag' hx-target='#feedback-{f.id}' hx-swap='outerHTML' class='text-red-600 text-sm ml-2'>🚩 {flag_label}</button>")
+        row += "<div>" + "".join(actions) + "</div>"
+    row += "</div>"
+    return row
+
+
+def _render_feedback_poller(event_id, cursor: FeedbackCursor) -> str:
+    # Swapped out-of-band so the next poll carries the cursor of the rows the client already holds
+    return (
+        f"<div id='feedback-poller' hx-swap-oob='true' hx-get='/events/{event_id}/feedback/stream?since={cursor.encode()}' "
+        f"hx-trigger='every {FEEDBACK_POLL_INTERVAL}' hx-target='#feedback-stream' hx-swap='beforeend'></div>"
+    )
+
+
+def _sse_message(event: str, data: str) -> str:
+    lines = "".join(f"data: {line}\n" for line in data.splitlines() or [""])
+    return f"event: {event}\n{lines}\n"
+
 @router.post("/", response_model=EventRead)
 async def create_event(
     event: EventCreate,
@@ -39,17 +92,28 @@ async def create_event(
 ):
     db_event = Event(**event.dict(), host_id=user.id)
     db.add(db_event)
+    await db.flush()
+    await rollups.ensure_stats(db, db_event.id)
     await db.commit()
+    calendar_cache.invalidate_user(user.id, db_event.datetime)
     await db.refresh(db_event)
     return db_event
 
 @router.get("/mine", response_model=list[EventRead])
 async def get_my_events(
-    db: AsyncSession = Depends(get_db),
+    response: Response,
+    limit: int = Query(EVENT_PAGE_SIZE, ge=1, le=EVENT_PAGE_MAX),
+    filters: EventFilters = Depends(event_filters),
+    cursor: EventCursor | None = Depends(event_cursor),
+    db: AsyncSession = Depends(get_read_db),
     user: User = Depends(current_active_user),
 ):
-    result = await db.execute(select(Event).where(Event.host_id == user.id))
-    events = result.scalars().all()
+    events, next_cursor = await host_events_page(db, user.id, filters, cursor, limit)
+    if next_cursor:
+        # Body stays a plain list; the next page is advertised the way GitHub-style APIs do
+        params = urlencode({**filters.query_params(), "limit": limit, "cursor": next_cursor.encode()})
+        response.headers["X-Next-Cursor"] = next_cursor.encode()
+        response.headers["Link"] = f'</events/mine?{params}>; rel="next"'
     return events
 
 
@@ -99,7 +163,10 @@ async def submit_event(
     )
     
     db.add(new_event)
+    await db.flush()
+    await rollups.ensure_stats(db, new_event.id)
     await db.commit()
+    calendar_cache.invalidate_user(user.id, new_event.datetime)
     return RedirectResponse(url="/dashboard", status_code=303)
 
 
@@ -110,15 +177,12 @@ async def live_feedback_page(
     user: User = Depends(current_active_user),
     db: AsyncSession = Depends(get_db),
 ):
-    result = await db.execute(select(Event).where(Event.id == event_id))
-    event = result.scalar_one_or_none()
+    event = await event_cache.get(db, event_id)
     if not event:
         raise HTTPException(status_code=404, detail="Event not found")
     if event.status == "Closed":
         return {"msg": "Event is closed"}
-    if event.status == "Scheduled" and user.id == event.host_id:
-        event.status = "Live"
-        await db.commit()
+    rsvp_count = checkin_count = 0
     if user.id != event.host_id:
         rsvp_result = await db.execute(select(RSVP).where(RSVP.event_id == event_id, RSVP.user_id == user.id))
         rsvp = rsvp_result.scalar_one_or_none()
@@ -126,14 +190,20 @@ async def live_feedback_page(
             raise HTTPException(status_code=403, detail="You must RSVP to view this page or Request the host to check you in")
         if not rsvp.check_in_time:
             raise HTTPException(status_code=403, detail="You must check in to view this page")
-    
+    else:
+        stats = await rollups.get_stats(db, event_id)
+        if stats:
+            rsvp_count, checkin_count = stats.rsvp_count, stats.checkin_count
+
     return templates.TemplateResponse("event_live.html", {
         "request": request,
         "event": event,
-        "user": user
+        "user": user,
+        "rsvp_count": rsvp_count,
+        "checkin_count": checkin_count
     })
 
-@router.post("/{event_id}/feedback")
+@router.post("/{event_id}/feedback", dependencies=[Depends(rate_limit("feedback_submit"))])
 async def submit_feedback(
     event_id: UUID,
     emoji: str = Form(...),
@@ -141,10 +211,28 @@ async def submit_feedback(
     user: User = Depends(current_active_user),
     db: AsyncSession = Depends(get_db),
 ):
-    feedback = Feedback(event_id=event_id, user_id=user.id, emoji=emoji, comment=comment)
-    db.add(feedback)
-    await db.commit()
-    await db.refresh(feedback)
+    event = await event_cache.get(db, event_id)
+    if not event:
+        raise HTTPException(status_code=404, detail="Event not found")
+    if event.status == "Closed":
+        raise HTTPException(status_code=409, detail="Event is closed")
+
+    if feedback_ingestor.enabled:
+        # Write-behind: queued for the next batched INSERT, answered from the submitted values
+        pending = PendingFeedback(id=uuid4(), event_id=event_id, user_id=user.id, emoji=emoji, comment=comment, timestamp=datetime.utcnow())
+        try:
+            feedback_ingestor.submit(pending)
+        except IngestQueueFull:
+            raise HTTPException(status_code=503, detail="Feedback is busy, please try again", headers={"Retry-After": "1"})
+    else:
+        feedback = Feedback(event_id=event_id, user_id=user.id, emoji=emoji, comment=comment)
+        db.add(feedback)
+        await db.flush()
+        await rollups.record_feedback(db, event_id, emoji, feedback.timestamp)
+        await feedback_notifier.notify(db, [FeedbackMessage.from_feedback("created", feedback)])
+        await summary.discard_snapshots(db, [event_id])
+        await db.commit()
+        announce_feedback(feedback)
 
     return HTMLResponse(content=f"""
   <div class='border-b py-2'>
@@ -160,22 +248,23 @@ async def toggle_pin_feedback(
     user: User = Depends(current_active_user),
     db: AsyncSession = Depends(get_db),
 ):
-    event_result = await db.execute(select(Event).where(Event.id == event_id))
-    event = event_result.scalar_one_or_none()
+    event = await event_cache.get(db, event_id)
     if not event or event.host_id != user.id:
         raise HTTPException(status_code=403, detail="Only the host can toggle pin")
 
-    result = await db.execute(select(Feedback).where(Feedback.id == feedback_id))
+    result = await db.execute(select(Feedback).where(Feedback.id == feedback_id, Feedback.event_id == event_id))
     feedback = result.scalar_one_or_none()
     if not feedback:
         raise HTTPException(status_code=404, detail="Feedback not found")
 
     feedback.pinned = not feedback.pinned
+    await rollups.record_moderation(db, event_id)
+    message = FeedbackMessage.from_feedback("updated", feedback)
+    await feedback_notifier.notify(db, [message])
     await db.commit()
+    apply_message(message)
 
-    return f"<div class='border-b py-2 flex justify-between items-center'><div><strong>{feedback.emoji}</strong> {feedback.comment or ''}</div><div>" + (
-        f"<button hx-post='/events/{event_id}/feedback/{feedback.id}/pin' class='text-yellow-600 text-sm ml-2'>⭐ {'Unpin' if feedback.pinned else 'Pin'}</button>"
-    ) + "</div></div>"
+    return _render_feedback_row(event_id, feedback, is_host=True)
 
 
 @router.post("/{event_id}/feedback/{feedback_id}/flag", response_class=HTMLResponse)
@@ -185,57 +274,128 @@ async def toggle_flag_feedback(
     user: User = Depends(current_active_user),
     db: AsyncSession = Depends(get_db),
 ):
-    event_result = await db.execute(select(Event).where(Event.id == event_id))
-    event = event_result.scalar_one_or_none()
+    event = await event_cache.get(db, event_id)
     if not event or event.host_id != user.id:
         raise HTTPException(status_code=403, detail="Only the host can toggle flag")
 
-    result = await db.execute(select(Feedback).where(Feedback.id == feedback_id))
+    result = await db.execute(select(Feedback).where(Feedback.id == feedback_id, Feedback.event_id == event_id))
     feedback = result.scalar_one_or_none()
     if not feedback:
         raise HTTPException(status_code=404, detail="Feedback not found")
 
     feedback.flagged = not feedback.flagged
+    await rollups.record_moderation(db, event_id)
+    message = FeedbackMessage.from_feedback("updated", feedback)
+    await feedback_notifier.notify(db, [message])
     await db.commit()
+    apply_message(message)
+
+    return _render_feedback_row(event_id, feedback, is_host=True)
 
-    return f"<div class='border-b py-2 flex justify-between items-center'><div><strong>{feedback.emoji}</strong> {feedback.comment or ''}</div><div>" + (
-        f"<button hx-post='/events/{event_id}/feedback/{feedback.id}/flag' class='text-red-600 text-sm ml-2'>🚩 {'Unflag' if feedback.flagged else 'Flag'}</button>"
-    ) + "</div></div>"
-    
 
-@router.get("/{event_id}/feedback/stream", response_class=HTMLResponse)
+@router.get("/{event_id}/feedback/stream", response_class=HTMLResponse, dependencies=[Depends(rate_limit("feedback_stream"))])
 async def live_feedback_stream(
     request: Request,
     event_id: UUID,
+    since: str | None = Query(None),
     user: User = Depends(current_active_user),
+    # Always the primary: cursor versions follow primary commits, and a lagging replica would let
+    # a cursor move past rows it hasn't replayed yet
     db: AsyncSession = Depends(get_db),
 ):
-    event_result = await db.execute(select(Event).where(Event.id == event_id))
-    event = event_result.scalar_one_or_none()
+    # A cursor from another worker is treated as none: the snapshot's ETag still spares the body
+    cursor = feedback_watermarks.own(FeedbackCursor.decode(since) if since else None)
+    mark = feedback_watermarks.get(event_id)
+    if cursor and mark and mark.version <= cursor.version:
+        return Response(status_code=204)
+
+    event = await event_cache.get(db, event_id)
     if not event:
         raise HTTPException(status_code=404, detail="Event not found")
 
     is_host = user.id == event.host_id
 
-    result = await db.execute(
-        select(Feedback).where(Feedback.event_id == event_id).order_by(Feedback.timestamp.desc()).limit(10)
-    )
-    feedbacks = result.scalars().all()
-
+    changes = None
+    if cursor and mark and mark.floor <= cursor.version:
+        # Read together, with no await in between, so the next cursor covers exactly these changes
+        version, changes = mark.version, mark.changed_since(cursor.version)
+        if not is_host:
+            # Attendees only see new rows; moderation changes are the host's
+            changes = {feedback_id: True for feedback_id, created in changes.items() if created}
+    if changes is None or len(changes) > FEEDBACK_DELTA_LIMIT:
+        # No usable cursor (first load, another or restarted worker, or too many changes since): send a full snapshot,
+        # unless the client already holds the snapshot for the current feedback version.
+        # Deltas are appended, so only these replace-the-list responses carry an ETag.
+        etag = make_etag("feedback", event_id, *await rollups.feedback_version(db, event_id), is_host)
+        if etag_matches(request, etag):
+            return not_modified(etag)
+        # Listen for other workers' changes before the baseline, so the mark can't miss any
+        await feedback_notifier.watch(event_id)
+        version = feedback_watermarks.baseline(event_id).version
+        result = await db.execute(
+            select(Feedback).where(Feedback.event_id == event_id).order_by(Feedback.timestamp.desc(), Feedback.id.desc()).limit(FEEDBACK_SNAPSHOT_SIZE)
+        )
+        feedbacks = list(reversed(result.scalars().all()))
+        next_cursor = feedback_watermarks.cursor(version)
+        body = "".join(_render_feedback_row(event_id, f, is_host) for f in feedbacks)
+        headers = {"HX-Reswap": "innerHTML"} if since else {}
+        return tag_response(HTMLResponse(body + _render_feedback_poller(event_id, next_cursor), headers=headers), etag)
+
+    # The delta is exactly the rows the change log recorded after the cursor, found by id. A row
+    # committed late (a write-behind batch, a slow transaction) is there however old its timestamp.
     rows = []
-    for f in reversed(feedbacks):
-        row = f"<div class='border-b py-2 flex justify-between items-center'><div><strong>{f.emoji}</strong> {f.comment or ''}</div>"
-        if is_host:
-            actions = []
-            pin_label = "Unpin" if f.pinned else "Pin"
-            flag_label = "Unflag" if f.flagged else "Flag"
-            actions.append(f"<button hx-post='/events/{event_id}/feedback/{f.id}/pin' class='text-yellow-600 text-sm ml-2'>⭐ {pin_label}</button>")
-            actions.append(f"<button hx-post='/events/{event_id}/feedback/{f.id}/flag' class='text-red-600 text-sm ml-2'>🚩 {flag_label}</button>")
-            row += "<div>" + "".join(actions) + "</div>"
-        row += "</div>"
-        rows.append(row)
-
-    return "".join(rows)
+    if changes:
+        result = await db.execute(
+            select(Feedback).where(Feedback.event_id == event_id, Feedback.id.in_(changes)).order_by(Feedback.timestamp, Feedback.id)
+        )
+        for f in result.scalars().all():
+            # New rows are appended; moderated ones the client already holds are swapped in place
+            rows.append(_render_feedback_row(event_id, f, is_host, oob=not changes[f.id]))
+    return HTMLResponse("".join(rows) + _render_feedback_poller(event_id, feedback_watermarks.cursor(version)))
+
+
+@router.get("/{event_id}/feedback/events", dependencies=[Depends(rate_limit("feedback_stream"))])
+async def live_feedback_events(
+    request: Request,
+    event_id: UUID,
+    user: User = Depends(current_active_user),
+    user_db=Depends(get_user_db),
+):
+    async with AsyncSessionLocal() as db:
+        event = await event_cache.get(db, event_id)
+    if not event:
+        raise HTTPException(status_code=404, detail="Event not found")
+
+    is_host = user.id == event.host_id
+    await feedback_notifier.watch(event_id)
+    # The auth lookup left a connection checked out; give it back before the stream parks on the queue.
+    await user_db.session.close()
+
+    async def stream():
+        with feedback_broadcaster.subscribe(event_id) as queue:
+            yield ": connected\n\n"
+            while True:
+                try:
+                    message = await asyncio.wait_for(queue.get(), timeout=SSE_KEEPALIVE_SECONDS)
+                except asyncio.TimeoutError:
+                    if await request.is_disconnected():
+                        break
+                    yield ": keepalive\n\n"
+                    continue
+                if message.kind == "updated":
+                    if not is_host:
+                        continue
+                    yield _sse_message("feedback", _render_feedback_row(event_id, message, is_host, oob=True))
+                else:
+                    # Pushes leave the poll cursor alone: a push can be dropped when this client's
+                    # queue is full, and the next poll's delta then brings the row anyway
+                    yield _sse_message("feedback", _render_feedback_row(event_id, message, is_host))
+
+    return StreamingResponse(
+        stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
 
 @router.get("/{event_id}/checkout")
 async def checkout_event(
@@ -244,18 +404,36 @@ async def checkout_event(
     user: User = Depends(current_active_user),
     db: AsyncSession = Depends(get_db)
 ):
-    result = await db.execute(select(Event).where(Event.id == event_id))
-    event = result.scalar_one_or_none()
+    event = await event_cache.get(db, event_id)
     if not event:
         raise HTTPException(status_code=404, detail="Event not found")
-    if user.id == event.host_id and event.status != "Closed":
-        event.status = "Closed"
-        await db.commit()
-        
+
     return templates.TemplateResponse("thank_you.html", {
         "request": request,
         "event": event
     })
+
+
+@router.post("/{event_id}/close")
+async def close_event(
+    event_id: UUID,
+    user: User = Depends(current_active_user),
+    db: AsyncSession = Depends(get_db)
+):
+    # Host ends the event early; otherwise the lifecycle scheduler closes it
+    event = await db.get(Event, event_id)
+    if not event or event.host_id != user.id:
+        raise HTTPException(status_code=403, detail="Only the host can close the event")
+    if event.status != "Closed":
+        event.status = "Closed"
+        await db.commit()
+        event_cache.invalidate(event_id)
+        calendar_cache.invalidate_month(event.datetime)
+        # Feedback queued here before the close belongs in the snapshot
+        await feedback_ingestor.flush()
+        await summary.write_snapshot(db, event_id)
+
+    return RedirectResponse(url=f"/events/{event_id}/checkout", status_code=303)
     
 
 
@@ -265,52 +443,87 @@ async def event_summary(
     request: Request,
     event_id: UUID,
     user: User = Depends(current_active_user),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
-    event_result = await db.execute(select(Event).where(Event.id == event_id))
-    event = event_result.scalar_one_or_none()
+    event = await event_cache.get(db, event_id)
     if not event or event.host_id != user.id:
         raise HTTPException(status_code=403, detail="Only the host can view the summary")
 
-    # RSVP + Check-in counts
-    rsvp_result = await db.execute(select(RSVP))
-    rsvps = rsvp_result.scalars().all()
-    rsvps = [r for r in rsvps if r.event_id == event_id]
-    total_rsvps = len(rsvps)
-    total_checkins = len([r for r in rsvps if r.check_in_time])
-
-    # Feedback aggregation
-    feedback_result = await db.execute(select(Feedback).where(Feedback.event_id == event_id))
-    feedbacks = feedback_result.scalars().all()
-
-    # Volume over time
-    feedback_volume = collections.Counter(f.timestamp.strftime("%Y-%m-%d %H:%M") for f in feedbacks)
-    feedback_volume_sorted = sorted(feedback_volume.items())
-
-    # Top emojis
-    emoji_counts = collections.Counter(f.emoji for f in feedbacks)
-    top_emojis = emoji_counts.most_common(3)
-
-    # Keyword extraction
-    import re
-    words = []
-    for f in feedbacks:
-        if f.comment:
-            words += re.findall(r"\b[a-zA-Z]{4,}\b", f.comment.lower())
-
-    # Get top 10 most common words, ignoring generic filler
-    ignore = {"this", "that", "with", "have", "your", "about", "from", "what", "which"}
-    filtered = [w for w in words if w not in ignore]
-    common_keywords = [word for word, _ in Counter(filtered).most_common(10)]
-    return templates.TemplateResponse("summary.html", {
-        "request": request,
-        "event": event,
-        "total_rsvps": total_rsvps,
-        "total_checkins": total_checkins,
-        "feedback_volume": feedback_volume_sorted,
-        "top_emojis": top_emojis,
-        "keywords": common_keywords
-    })
+    if event.status == "Closed":
+        # Frozen once the event closes; written on close, or here when missing (closed before snapshots
+        # existed, or discarded because queued feedback landed after the close)
+        snapshot = await summary.get_snapshot(db, event_id)
+        if snapshot is None:
+            async with AsyncSessionLocal() as primary:
+                snapshot = await summary.write_snapshot(primary, event_id)
+        etag = make_etag("summary-snapshot", event.id, snapshot.generated_at)
+        # Revalidated like the live summary, so a regenerated snapshot shows up on the next visit
+        if etag_matches(request, etag):
+            return not_modified(etag)
+        return tag_response(
+            templates.TemplateResponse("summary.html", {"request": request, "event": event, **snapshot.data}),
+            etag,
+        )
+
+    # RSVP + Check-in counts, volume over time and top emojis all come from the rollups;
+    # everything shown is derived from the event row and these counters
+    stats = await rollups.get_stats(db, event_id)
+    etag = make_etag(
+        "summary", event.id, event.updated_at,
+        *((stats.rsvp_count, stats.checkin_count, stats.feedback_count) if stats else (0, 0, 0)),
+    )
+    if etag_matches(request, etag):
+        return not_modified(etag)
+
+    data = await summary.compute_summary(db, event_id, stats)
+    return tag_response(templates.TemplateResponse("summary.html", {"request": request, "event": event, **data}), etag)
+
+
+async def _export_response(event_id: UUID, user: User, user_db, name: str, query, fmt: ExportFormat) -> StreamingResponse:
+    async with AsyncSessionLocal() as db:
+        event = await event_cache.get(db, event_id)
+    if not event or event.host_id != user.id:
+        raise HTTPException(status_code=403, detail="Only the host can export event data")
+    # The export reads on its own session; don't hold the auth lookup's connection for the whole download
+    await user_db.session.close()
+
+    extension = "csv" if fmt == "csv" else "ndjson"
+    return StreamingResponse(
+        stream_export(query, fmt),
+        media_type=MEDIA_TYPES[fmt],
+        headers={"Content-Disposition": f"attachment; filename=event-{event_id}-{name}.{extension}"},
+    )
+
+
+@router.get("/{event_id}/export/feedback")
+async def export_feedback(
+    event_id: UUID,
+    format: ExportFormat = Query("csv"),
+    user: User = Depends(current_active_user),
+    user_db=Depends(get_user_db),
+):
+    query = (
+        select(Feedback.id, Feedback.user_id, Feedback.emoji, Feedback.comment, Feedback.timestamp, Feedback.pinned, Feedback.flagged)
+        .where(Feedback.event_id == event_id)
+        .order_by(Feedback.timestamp, Feedback.id)
+    )
+    return await _export_response(event_id, user, user_db, "feedback", query, format)
+
+
+@router.get("/{event_id}/export/attendees")
+async def export_attendees(
+    event_id: UUID,
+    format: ExportFormat = Query("csv"),
+    user: User = Depends(current_active_user),
+    user_db=Depends(get_user_db),
+):
+    query = (
+        select(User.id.label("user_id"), User.email, User.username, User.full_name, RSVP.check_in_time)
+        .join(User, User.id == RSVP.user_id)
+        .where(RSVP.event_id == event_id)
+        .order_by(RSVP.user_id)
+    )
+    return await _export_response(event_id, user, user_db, "attendees", query, format)
 
 
 @router.get("/{event_id}")
@@ -320,8 +533,7 @@ async def view_event_detail(
     user: User = Depends(current_active_user),
     db: AsyncSession = Depends(get_db)
 ):
-    result = await db.execute(select(Event).where(Event.id == event_id))
-    event = result.scalar_one_or_none()
+    event = await event_cache.get(db, event_id)
 
     if not event:
         raise HTTPException(status_code=404, detail="Event not found")
@@ -336,12 +548,15 @@ async def view_event_detail(
     checkin_open = (
         current_utc_time >= checkin_window_start # Before event closes
     )
-    return templates.TemplateResponse("event_detail.html", {
+    etag = make_etag("event", event.id, event.updated_at, rsvp_open, checkin_open)
+    if etag_matches(request, etag):
+        return not_modified(etag)
+    return tag_response(templates.TemplateResponse("event_detail.html", {
         "request": request,
         "event": event,
         "show_rsvp": rsvp_open,
         "show_checkin": checkin_open
-    })
+    }), etag)
 
 @router.get("/{event_id}/edit")
 async def edit_event_form(
@@ -350,8 +565,7 @@ async def edit_event_form(
     user: User = Depends(current_active_user),
     db: AsyncSession = Depends(get_db)
 ):
-    result = await db.execute(select(Event).where(Event.id == event_id))
-    event = result.scalar_one_or_none()
+    event = await event_cache.get(db, event_id)
 
     if not event or event.host_id != user.id:
         raise HTTPException(status_code=403, detail="You are not authorized to edit this event")
@@ -375,8 +589,7 @@ async def update_event(
     rsvp_deadline: datetime = Form(...),
     max_attendees: int = Form(...),
 ):
-    result = await db.execute(select(Event).where(Event.id == event_id))
-    event = result.scalar_one_or_none()
+    event = await db.get(Event, event_id)
 
     if not event or event.host_id != user.id:
         raise HTTPException(status_code=403, detail="Not allowed")
@@ -388,6 +601,7 @@ async def update_event(
             "error": "RSVP deadline must be before event start time"
         })
 
+    previous_datetime = event.datetime
     event.title = title
     event.description = description
     event.datetime = datetime
@@ -396,6 +610,9 @@ async def update_event(
     event.max_attendees = max_attendees
 
     await db.commit()
+    event_cache.invalidate(event_id)
+    calendar_cache.invalidate_month(previous_datetime)
+    calendar_cache.invalidate_month(datetime)
 
     return RedirectResponse("/dashboard", status_code=302)
 
@@ -405,28 +622,31 @@ async def delete_event(
     user: User = Depends(current_active_user),
     db: AsyncSession = Depends(get_db)
 ):
-    result = await db.execute(select(Event).where(Event.id == event_id))
-    event = result.scalar_one_or_none()
+    event = await db.get(Event, event_id)
 
     if not event or event.host_id != user.id:
         raise HTTPException(status_code=403, detail="Not allowed")
 
     await db.delete(event)
     await db.commit()
+    event_cache.invalidate(event_id)
+    await feedback_notifier.unwatch(event_id)
+    feedback_watermarks.discard(event_id)
+    keyword_index.discard(event_id)
+    calendar_cache.invalidate_month(event.datetime)
 
     return RedirectResponse("/dashboard", status_code=302)
 
 
 
-@router.post("/{event_id}/rsvp")
+@router.post("/{event_id}/rsvp", dependencies=[Depends(rate_limit("rsvp"))])
 async def rsvp_event(
     event_id: UUID,
     request: Request,
     user: User = Depends(current_active_user),
     db: AsyncSession = Depends(get_db)
 ):
-    result = await db.execute(select(Event).where(Event.id == event_id))
-    event = result.scalar_one_or_none()
+    event = await event_cache.get(db, event_id)
 
     if not event:
         raise HTTPException(status_code=404, detail="Event not found")
@@ -435,18 +655,16 @@ async def rsvp_event(
     if today > event.rsvp_deadline.date():
         raise HTTPException(status_code=400, detail="RSVP deadline has passed")
 
-    existing_rsvp = await db.execute(
-        select(RSVP).where(RSVP.event_id == event_id, RSVP.user_id == user.id)
-    )
-    if existing_rsvp.scalar_one_or_none():
+    outcome = await rollups.reserve_rsvp(db, event_id, user.id)
+    if outcome == "duplicate":
         raise HTTPException(status_code=409, detail="Already RSVPed")
+    if outcome == "full":
+        raise HTTPException(status_code=409, detail="Event is full")
 
-    rsvp = RSVP(event_id=event_id, user_id=user.id)
-    db.add(rsvp)
-    await db.commit()
+    calendar_cache.invalidate_user(user.id, event.datetime)
     return {"msg":f"You're confirmed for '{event.title}' at {event.datetime.strftime('%Y-%m-%d %H:%M')} . Email Sent To: {user.email}"}
 
-@router.post("/{event_id}/checkin")
+@router.post("/{event_id}/checkin", dependencies=[Depends(rate_limit("checkin"))])
 async def checkin_event(
     event_id: UUID,
     request: Request,
@@ -460,8 +678,7 @@ async def checkin_event(
         raise HTTPException(status_code=404, detail="RSVP not found")
 
     today = datetime.utcnow().date()
-    event_result = await db.execute(select(Event).where(Event.id == event_id))
-    event = event_result.scalar_one_or_none()
+    event = await event_cache.get(db, event_id)
 
     if not event:
         raise HTTPException(status_code=404, detail="Event not found")
@@ -475,12 +692,25 @@ async def checkin_event(
     if checkin_open is False:
         raise HTTPException(status_code=400, detail="Check-in only allowed on event day")
 
-    rsvp.check_in_time = datetime.utcnow()
+    if await _check_in(db, rsvp.id):
+        await rollups.record_checkin(db, event_id)
     await db.commit()
     return RedirectResponse(url=f"/events/{event_id}/live", status_code=303)
 
 
-@router.post("/{event_id}/walkin")
+async def _check_in(db: AsyncSession, rsvp_id: UUID) -> bool:
+    # Conditional, so of two concurrent check-ins only one sees a row come back and counts it
+    result = await db.execute(
+        update(RSVP)
+        .where(RSVP.id == rsvp_id, RSVP.check_in_time.is_(None))
+        .values(check_in_time=datetime.utcnow())
+        .returning(RSVP.id)
+        .execution_options(synchronize_session=False)
+    )
+    return result.scalar_one_or_none() is not None
+
+
+@router.post("/{event_id}/walkin", dependencies=[Depends(rate_limit("walkin"))])
 async def mark_walkin(
     request: Request,
     event_id: UUID,
@@ -491,8 +721,7 @@ async def mark_walkin(
     from datetime import datetime
     from app.models.user import User as AppUser
 
-    result = await db.execute(select(Event).where(Event.id == event_id))
-    event = result.scalar_one_or_none()
+    event = await event_cache.get(db, event_id)
 
     if not event or event.host_id != user.id:
         raise HTTPException(status_code=403, detail="Not authorized")
@@ -511,10 +740,75 @@ async def mark_walkin(
         # Create new RSVP with check-in
         new_rsvp = RSVP(user_id=attendee.id, event_id=event_id, check_in_time=datetime.utcnow())
         db.add(new_rsvp)
-    elif not rsvp.check_in_time:
-        # Just check in
-        rsvp.check_in_time = datetime.utcnow()
+        await db.flush()
+        await rollups.record_rsvp(db, event_id, checked_in=True)
+        calendar_cache.invalidate_user(attendee.id, event.datetime)
+    elif await _check_in(db, rsvp.id):
+        await rollups.record_checkin(db, event_id)
 
     await db.commit()
 
     return RedirectResponse(f"/events/{event_id}/live", status_code=303)
+
+
+def _parse_emails(raw: str) -> list[str]:
+    # Accepts one email per line or a CSV row/column; keeps first-seen order, drops duplicates
+    return list(dict.fromkeys(e.strip().strip('"') for e in EMAIL_SEPARATORS.split(raw) if e.strip().strip('"')))
+
+
+@router.post("/{event_id}/walkin/bulk", dependencies=[Depends(rate_limit("walkin_bulk"))])
+async def mark_walkins_bulk(
+    request: Request,
+    event_id: UUID,
+    emails: str = Form(...),
+    user: User = Depends(current_active_user),
+    db: AsyncSession = Depends(get_db),
+):
+    event = await event_cache.get(db, event_id)
+
+    if not event or event.host_id != user.id:
+        raise HTTPException(status_code=403, detail="Not authorized")
+
+    email_list = _parse_emails(emails)
+    if len(email_list) > WALKIN_BULK_MAX_EMAILS:
+        raise HTTPException(status_code=400, detail=f"At most {WALKIN_BULK_MAX_EMAILS} emails per request")
+
+    results = {email: "unknown" for email in email_list}
+    if email_list:
+        user_rows = await db.execute(select(User.id, User.email).where(User.email.in_(email_list)))
+        user_emails = {user_id: email for user_id, email in user_rows.all()}
+
+        if user_emails:
+            # One upsert for everyone: new walk-ins get an RSVP with check-in, existing RSVPs get a
+            # check-in time, rows already checked in are left untouched and so are not returned.
+            # Sorted so concurrent bulk posts lock rsvp rows in the same order.
+            now = datetime.utcnow()
+            stmt = insert(RSVP).values([
+                {"id": uuid4(), "event_id": event_id, "user_id": user_id, "check_in_time": now}
+                for user_id in sorted(user_emails)
+            ])
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[RSVP.event_id, RSVP.user_id],
+                set_={"check_in_time": stmt.excluded.check_in_time},
+                where=RSVP.check_in_time.is_(None),
+            ).returning(RSVP.user_id, literal_column("xmax = 0").label("inserted"))
+            changed = (await db.execute(stmt)).all()
+
+            for user_id in user_emails:
+                results[user_emails[user_id]] = "already_checked_in"
+            new_rsvps = [user_id for user_id, inserted in changed if inserted]
+            for user_id, _ in changed:
+                results[user_emails[user_id]] = "checked_in"
+            if changed:
+                await rollups.record_walkins(db, event_id, rsvps=len(new_rsvps), checkins=len(changed))
+            await db.commit()
+            for user_id in new_rsvps:
+                calendar_cache.invalidate_user(user_id, event.datetime)
+
+    totals = Counter(results.values())
+    if request.headers.get("HX-Request"):
+        labels = {"checked_in": "✅ Checked in", "already_checked_in": "☑️ Already checked in", "unknown": "❓ Unknown email"}
+        rows = "".join(f"<li>{escape(email)} - {labels[outcome]}</li>" for email, outcome in results.items())
+        message = f"{totals['checked_in']} checked in, {totals['already_checked_in']} already checked in, {totals['unknown']} unknown"
+        return HTMLResponse(f"<p class='text-sm font-semibold'>{message}</p><ul class='text-sm'>{rows}</ul>")
+    return {"results": results, "totals": dict(totals)}
@@ -0,0 +1,54 @@
+from fastapi import APIRouter, Depends
+
+from app.core.calendar_cache import calendar_cache
+from app.core.config import settings
+from app.core.event_cache import event_cache
+from app.core.ratelimit import rate_limit
+from app.db.pool import describe_pool
+from app.db.session import engine, replica_engine
+from app.live.ingest import feedback_ingestor
+from app.live.lifecycle import lifecycle_scheduler
+from app.live.notify import feedback_notifier
+from app.models.user import User
+from app.users import current_superuser
+from app.users.cache import user_cache
+
+# Operational endpoints for sizing and debugging; superusers only.
+router = APIRouter()
+
+
+@router.get("/pool")
+async def pool_status(user: User = Depends(current_superuser)):
+    pools = {"profile": settings.DB_PROFILE, "primary": describe_pool(engine.pool)}
+    if replica_engine is not None:
+        pools["replica"] = describe_pool(replica_engine.pool)
+    return pools
+
+
+@router.get("/caches")
+async def cache_status(user: User = Depends(current_superuser)):
+    return {
+        "users": user_cache.stats(),
+        "events": event_cache.stats(),
+        "calendar": calendar_cache.stats(),
+    }
+
+
+@router.get("/ingest")
+async def ingest_status(user: User = Depends(current_superuser)):
+    return feedback_ingestor.stats()
+
+
+@router.get("/notify")
+async def notify_status(user: User = Depends(current_superuser)):
+    return feedback_notifier.stats()
+
+
+@router.get("/ratelimits")
+async def rate_limit_status(user: User = Depends(current_superuser)):
+    return {"enabled": rate_limit.enabled, "routes": rate_limit.stats()}
+
+
+@router.get("/lifecycle")
+async def lifecycle_status(user: User = Depends(current_superuser)):
+    return lifecycle_scheduler.stats()
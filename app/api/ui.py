@@ -1,6 +1,5 @@
-from fastapi import APIRouter, Depends, Form, Request, Path, status, HTTPException
+from fastapi import APIRouter, Depends, Form, Request, Path, Query, status, HTTPException
 from fastapi.responses import RedirectResponse, HTMLResponse
-from fastapi.templating import Jinja2Templates
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 from uuid import UUID
@@ -8,30 +7,73 @@ from datetime import datetime, date, timedelta
 
 from app.models.event import Event
 from app.models.user import User
-from sqlalchemy import func
+from sqlalchemy import func, union
 
 from app.models.rsvp import RSVP
 
+from app.db.routing import get_read_db
 from app.db.session import AsyncSessionLocal
-from app.users import current_active_user
+from app.users import UserManager, auth_backend, cookie_transport, current_active_user, get_user_manager
+from app.schemas.user import UserCreate
+from app.analytics import rollups
+from app.core.calendar_cache import CalendarEntry, calendar_cache
+from app.core.pagination import EventCursor, EventFilters, event_cursor, event_filters, host_events_page
+from app.core.templates import templates
+from urllib.parse import urlencode
 import calendar
 
-
-import httpx
+from fastapi.security import OAuth2PasswordRequestForm
+from fastapi_users import exceptions
+from fastapi_users.authentication import Strategy
+from pydantic import ValidationError
+from sqlalchemy.exc import IntegrityError
 
 
 router = APIRouter()
-templates = Jinja2Templates(directory="app/templates")
+
+CALENDAR_MIN_YEAR, CALENDAR_MAX_YEAR = 1, 9998
 
 async def get_db():
     async with AsyncSessionLocal() as session:
         yield session
 
+async def _calendar_entries(db: AsyncSession, user_id: UUID, month_start: datetime, month_end: datetime) -> list[CalendarEntry]:
+    # Hosted and RSVPed events in one round trip
+    in_month = (Event.datetime >= month_start, Event.datetime < month_end)
+    hosted = select(Event.id).where(Event.host_id == user_id, *in_month)
+    rsvped = select(RSVP.event_id).join(Event, Event.id == RSVP.event_id).where(RSVP.user_id == user_id, *in_month)
+    result = await db.execute(select(Event).where(Event.id.in_(union(hosted, rsvped))).order_by(Event.datetime))
+    return [CalendarEntry(e.id, e.title, e.status, e.datetime) for e in result.scalars().all()]
+
+async def _dashboard_page(user: User, filters: EventFilters, cursor: EventCursor | None, db: AsyncSession) -> dict:
+    events, next_cursor = await host_events_page(db, user.id, filters, cursor)
+    stats = await rollups.get_stats_for(db, [e.id for e in events])
+    next_url = None
+    if next_cursor:
+        next_url = "/dashboard/events?" + urlencode({**filters.query_params(), "cursor": next_cursor.encode()})
+    return {"user": user, "events": events, "stats": stats, "next_url": next_url}
+
 @router.get("/dashboard")
-async def view_dashboard(request: Request, user: User = Depends(current_active_user), db: AsyncSession = Depends(get_db)):
-    result = await db.execute(select(Event).where(Event.host_id == user.id))
-    events = result.scalars().all()
-    return templates.TemplateResponse("dashboard.html", {"request": request, "user": user, "events": events})
+async def view_dashboard(
+    request: Request,
+    filters: EventFilters = Depends(event_filters),
+    user: User = Depends(current_active_user),
+    db: AsyncSession = Depends(get_read_db),
+):
+    page = await _dashboard_page(user, filters, None, db)
+    return templates.TemplateResponse("dashboard.html", {"request": request, "filters": filters, **page})
+
+@router.get("/dashboard/events", response_class=HTMLResponse)
+async def dashboard_events_page(
+    request: Request,
+    filters: EventFilters = Depends(event_filters),
+    cursor: EventCursor | None = Depends(event_cursor),
+    user: User = Depends(current_active_user),
+    db: AsyncSession = Depends(get_read_db),
+):
+    # Next slice for the dashboard's infinite scroll
+    page = await _dashboard_page(user, filters, cursor, db)
+    return templates.TemplateResponse("_dashboard_events.html", {"request": request, **page})
 
 
 
@@ -39,29 +81,33 @@ async def view_dashboard(request: Request, user: User = Depends(current_active_u
 async def login_form(request: Request):
     return templates.TemplateResponse("login.html", {"request": request})
 
+async def _login_redirect(request: Request, user: User, user_manager: UserManager, strategy: Strategy) -> RedirectResponse:
+    # Same token and cookie the /auth/jwt/login route would issue, without the HTTP hop
+    token = await strategy.write_token(user)
+    redirect = RedirectResponse(url="/dashboard", status_code=status.HTTP_303_SEE_OTHER)
+    redirect.set_cookie(
+        key=cookie_transport.cookie_name,
+        value=token,
+        httponly=True,
+        max_age=cookie_transport.cookie_max_age,
+        path="/",
+    )
+    await user_manager.on_after_login(user, request, redirect)
+    return redirect
+
 @router.post("/login")
 async def login_post(
     request: Request,
     username: str = Form(...),
     password: str = Form(...),
+    user_manager: UserManager = Depends(get_user_manager),
+    strategy: Strategy = Depends(auth_backend.get_strategy),
 ):
-    async with httpx.AsyncClient() as client:
-        response = await client.post(
-            "http://localhost:10000/auth/jwt/login",
-            data={"username": username, "password": password},
-            headers={"Content-Type": "application/x-www-form-urlencoded"},
-        )
-        if response.status_code == 204:
-            redirect = RedirectResponse(url="/dashboard", status_code=status.HTTP_303_SEE_OTHER)
-            redirect.set_cookie(
-                key="eventpulse",
-                value=response.cookies.get("eventpulse"),
-                httponly=True,
-                max_age=3600,
-                path="/",
-            )
-            return redirect
+    credentials = OAuth2PasswordRequestForm(username=username, password=password)
+    user = await user_manager.authenticate(credentials)
+    if user is None or not user.is_active:
         raise HTTPException(status_code=401, detail="Invalid credentials")
+    return await _login_redirect(request, user, user_manager, strategy)
 
 @router.get("/register", response_class=HTMLResponse)
 async def register_form(request: Request):
@@ -74,21 +120,16 @@ async def register_post(
     username: str = Form(...),
     full_name: str = Form(None),
     password: str = Form(...),
+    user_manager: UserManager = Depends(get_user_manager),
+    strategy: Strategy = Depends(auth_backend.get_strategy),
 ):
-    async with httpx.AsyncClient() as client:
-        response = await client.post(
-            "http://localhost:10000/auth/register",
-            json={
-                "email": email,
-                "username": username,
-                "full_name": full_name,
-                "password": password
-            },
-        )
-        if response.status_code == 201:
-            # auto-login after register
-            return await login_post(request, username=email, password=password)
+    try:
+        user_create = UserCreate(email=email, username=username, full_name=full_name, password=password)
+        user = await user_manager.create(user_create, safe=True, request=request)
+    except (ValidationError, exceptions.UserAlreadyExists, exceptions.InvalidPasswordException, IntegrityError):
         raise HTTPException(status_code=400, detail="Registration failed")
+    # auto-login after register
+    return await _login_redirect(request, user, user_manager, strategy)
 
 @router.get("/logout")
 async def logout():
@@ -100,12 +141,15 @@ async def logout():
 @router.get("/calendar")
 async def calendar_month_view(
     request: Request,
+    # The month after the last one shown must still be a valid datetime
+    year: int | None = Query(None, ge=CALENDAR_MIN_YEAR, le=CALENDAR_MAX_YEAR),
+    month: int | None = Query(None, ge=1, le=12),
     user: User = Depends(current_active_user),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ):
     today = datetime.utcnow()
-    year = today.year
-    month = today.month
+    year = year or today.year
+    month = month or today.month
     month_name = calendar.month_name[month]
     now = datetime.utcnow()
 
@@ -114,34 +158,31 @@ async def calendar_month_view(
     next_month = month + 1 if month < 12 else 1
     next_year = year if month < 12 else year + 1
     month_end = datetime(next_year, next_month, 1)
-
-    # Hosted events
-    host_result = await db.execute(
-        select(Event).where(Event.host_id == user.id, Event.datetime >= month_start, Event.datetime < month_end)
-    )
-    hosted_events = host_result.scalars().all()
-
-    # RSVPed events
-    rsvp_result = await db.execute(select(RSVP).where(RSVP.user_id == user.id))
-    rsvped_events = []
-    for rsvp in rsvp_result.scalars().all():
-        e_result = await db.execute(
-            select(Event).where(Event.id == rsvp.event_id, Event.datetime >= month_start, Event.datetime < month_end)
-        )
-        e = e_result.scalar_one_or_none()
-        if e:
-            rsvped_events.append(e)
-
-    all_events = {e.id: e for e in hosted_events + rsvped_events}.values()
-
-    for e in all_events:
-        e.show_join = e.status == "Live" or (now >= e.datetime and now <= e.datetime + timedelta(hours=1))
+    prev_month = month - 1 if month > 1 else 12
+    prev_year = year if month > 1 else year - 1
+
+    entries = calendar_cache.get(user.id, year, month)
+    if entries is None:
+        if db.info.get("replica"):
+            # Shared by every request until it expires, so fill it from the primary: a lagging
+            # replica read right after an invalidation would cache the old month again
+            async with AsyncSessionLocal() as primary:
+                entries = await _calendar_entries(primary, user.id, month_start, month_end)
+        else:
+            entries = await _calendar_entries(db, user.id, month_start, month_end)
+        calendar_cache.set(user.id, year, month, entries)
 
     # Build calendar cells
     day_map = {}
-    for e in all_events:
-        day = e.datetime.day
-        day_map.setdefault(day, []).append(e)
+    for e in entries:
+        show_join = e.status == "Live" or (now >= e.datetime and now <= e.datetime + timedelta(hours=1))
+        day_map.setdefault(e.datetime.day, []).append({
+            "id": e.id,
+            "title": e.title,
+            "status": e.status,
+            "datetime": e.datetime,
+            "show_join": show_join,
+        })
 
     first_weekday, total_days = calendar.monthrange(year, month)
     start_padding = (first_weekday - 0) % 7
@@ -159,5 +200,10 @@ async def calendar_month_view(
         "year": year,
         "month_name": month_name,
         "calendar_cells": calendar_cells,
+        # No links past the years the view accepts
+        "prev_year": prev_year if prev_year >= CALENDAR_MIN_YEAR else None,
+        "prev_month": prev_month,
+        "next_year": next_year if next_year <= CALENDAR_MAX_YEAR else None,
+        "next_month": next_month,
         "now": today
-    })
\ No newline at end of file
+    })
@@ -0,0 +1,67 @@
+# app/core/calendar_cache.py
+from collections import defaultdict
+from dataclasses import dataclass
+from datetime import datetime
+from uuid import UUID
+
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.core.invalidation import invalidation_bus
+
+
+@dataclass(frozen=True)
+class CalendarEntry:
+    id: UUID
+    title: str
+    status: str
+    datetime: datetime
+
+
+class CalendarCache:
+    """Caches each user's events for a month.
+
+    RSVPs invalidate one user's month. Edits, deletes and status changes bump a per-month
+    generation instead, since any number of users may have that event on their grid.
+    """
+
+    def __init__(self, maxsize: int, ttl_seconds: float):
+        self._entries = TTLCache(maxsize, ttl_seconds)
+        self._generations: dict[tuple[int, int], int] = defaultdict(int)
+
+    def get(self, user_id: UUID, year: int, month: int) -> list[CalendarEntry] | None:
+        cached = self._entries.get((user_id, year, month))
+        if cached is None:
+            return None
+        generation, entries = cached
+        if generation != self._generations[(year, month)]:
+            self._entries.invalidate((user_id, year, month))
+            return None
+        return entries
+
+    def set(self, user_id: UUID, year: int, month: int, entries: list[CalendarEntry]) -> None:
+        self._entries.set((user_id, year, month), (self._generations[(year, month)], entries))
+
+    def invalidate_user(self, user_id: UUID, when: datetime) -> None:
+        self._forget_user(user_id.hex, when.year, when.month)
+        invalidation_bus.publish("calendar_user", user_id.hex, when.year, when.month)
+
+    def invalidate_month(self, when: datetime) -> None:
+        self._forget_month(when.year, when.month)
+        invalidation_bus.publish("calendar_month", when.year, when.month)
+
+    def _forget_user(self, user_id_hex: str, year: int, month: int) -> None:
+        self._entries.invalidate((UUID(hex=user_id_hex), year, month))
+
+    def _forget_month(self, year: int, month: int) -> None:
+        self._generations[(year, month)] += 1
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def stats(self) -> dict:
+        return self._entries.stats()
+
+
+calendar_cache = CalendarCache(settings.CALENDAR_CACHE_SIZE, settings.CALENDAR_CACHE_TTL_SECONDS)
+invalidation_bus.register("calendar_user", calendar_cache._forget_user, calendar_cache.clear)
+invalidation_bus.register("calendar_month", calendar_cache._forget_month, calendar_cache.clear)
@@ -1,9 +1,109 @@
+from typing import Literal
+
 from pydantic_settings import BaseSettings
 
 class Settings(BaseSettings):
     DATABASE_URL: str
     SECRET: str
 
+    # Optional read replica (app/db/routing.py). A client that wrote something is pinned to the
+    # primary for READ_YOUR_WRITES_SECONDS so it sees its own changes.
+    DATABASE_REPLICA_URL: str | None = None
+    READ_YOUR_WRITES_SECONDS: float = 5
+
+    # Database engine (app/db/session.py). Unset values fall back to the DB_PROFILE defaults.
+    DB_PROFILE: Literal["dev", "prod", "bench"] = "dev"
+    DB_ECHO: bool | None = None
+    DB_POOL_SIZE: int | None = None
+    DB_MAX_OVERFLOW: int | None = None
+    DB_POOL_TIMEOUT: float | None = None
+    DB_POOL_RECYCLE: int | None = None
+    DB_POOL_PRE_PING: bool | None = None
+    # asyncpg prepared statement cache per connection; 0 when running behind pgbouncer
+    DB_STATEMENT_CACHE_SIZE: int | None = None
+
+    # Level of the `app.*` loggers (startup timings, background task errors)
+    LOG_LEVEL: str = "INFO"
+
+    # Keyword cloud on the event summary (app/analytics/keywords.py)
+    KEYWORD_STOP_WORDS: set[str] = {"this", "that", "with", "have", "your", "about", "from", "what", "which"}
+    KEYWORD_TOP_K_CAPACITY: int = 200
+    KEYWORD_TRACKER_TTL_SECONDS: int = 300
+    # Processes used to tokenize large comment sets off the event loop; 0 uses the default thread pool
+    KEYWORD_WORKERS: int = 2
+
+    # The user, event and calendar caches below are per worker. Invalidations reach the other
+    # workers over LISTEN/NOTIFY (FEEDBACK_NOTIFY_ENABLED); with that off, or if a notification
+    # is lost, another worker can serve a stale entry for up to its TTL.
+
+    # Authenticated users resolved from JWTs (app/users/cache.py)
+    USER_CACHE_SIZE: int = 10_000
+    USER_CACHE_TTL_SECONDS: int = 60
+
+    # Event rows for permission/status checks (app/core/event_cache.py)
+    EVENT_CACHE_SIZE: int = 5_000
+    EVENT_CACHE_TTL_SECONDS: int = 30
+
+    # Live feedback writes (app/live/ingest.py): "direct" commits per request, "batched"
+    # queues rows and flushes multi-row INSERTs every FEEDBACK_BATCH_INTERVAL_MS or MAX_ROWS
+    FEEDBACK_INGEST_MODE: Literal["direct", "batched"] = "direct"
+    FEEDBACK_BATCH_MAX_ROWS: int = 500
+    FEEDBACK_BATCH_INTERVAL_MS: int = 50
+    FEEDBACK_QUEUE_SIZE: int = 10_000
+    # A failed flush is retried with backoff up to this cap until it succeeds; at shutdown only
+    # this many more times, after which the rows are logged for replay
+    FEEDBACK_FLUSH_MAX_BACKOFF_SECONDS: float = 5
+    FEEDBACK_FLUSH_SHUTDOWN_RETRIES: int = 3
+
+    # Token buckets per (user, event, route) (app/core/ratelimit.py), "<burst>/<seconds>s"
+    RATE_LIMIT_ENABLED: bool = True
+    RATE_LIMITS: dict[str, str] = {
+        "feedback_submit": "20/10s",
+        "feedback_stream": "60/60s",
+        "rsvp": "10/60s",
+        "checkin": "10/60s",
+        "walkin": "300/60s",
+        "walkin_bulk": "30/60s",
+    }
+
+    # Cross-worker live updates and cache invalidations over Postgres LISTEN/NOTIFY
+    # (app/live/notify.py). Single-worker deployments can turn this off.
+    FEEDBACK_NOTIFY_ENABLED: bool = True
+    FEEDBACK_NOTIFY_MAX_CHANNELS: int = 10_000
+
+    # Background Scheduled -> Live -> Closed transitions (app/live/lifecycle.py).
+    # Only events that started within EVENT_AUTO_START_WINDOW_HOURS go Live, so past events that
+    # were never opened are not flipped to Live on the first sweep. Events have no end time, so by default only the host closes them ("End event"). Setting
+    # EVENT_AUTO_CLOSE_AFTER_HOURS closes events that long after they start. The first sweep after
+    # it is set also closes, and snapshots, every older Scheduled or Live event.
+    LIFECYCLE_ENABLED: bool = True
+    LIFECYCLE_INTERVAL_SECONDS: float = 30
+    LIFECYCLE_BATCH_SIZE: int = 500
+    EVENT_AUTO_START_WINDOW_HOURS: float = 1
+    EVENT_AUTO_CLOSE_AFTER_HOURS: float | None = None
+
+    # Per-user month grids on /calendar (app/core/calendar_cache.py)
+    CALENDAR_CACHE_SIZE: int = 10_000
+    CALENDAR_CACHE_TTL_SECONDS: int = 60
+
+    # Request metrics on /metrics (app/core/metrics.py). With METRICS_TOKEN set, scrapers must send
+    # "Authorization: Bearer <token>". Requests slower than SLOW_REQUEST_MS are logged with their SQL.
+    METRICS_ENABLED: bool = True
+    METRICS_TOKEN: str | None = None
+    SLOW_REQUEST_MS: float | None = 500
+    SLOW_REQUEST_MAX_QUERIES: int = 100
+
+    # Worker startup (app/main.py). Deployments that run `alembic upgrade head` as a release step can
+    # skip the per-worker schema check. DB_POOL_PREWARM connections (capped at the pool size) are
+    # opened before the worker reports ready on /ready.
+    STARTUP_SCHEMA_CHECK: bool = True
+    DB_POOL_PREWARM: int = 0
+    TEMPLATE_PRECOMPILE: bool = True
+    # Compiled templates shared on disk between workers and restarts (app/core/templates.py)
+    TEMPLATE_BYTECODE_CACHE_DIR: str | None = None
+    # Re-check template files for changes on every render; off in production
+    TEMPLATE_AUTO_RELOAD: bool = True
+
     class Config:
         env_file = ".env"
 
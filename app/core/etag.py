@@ -0,0 +1,33 @@
+# app/core/etag.py
+import hashlib
+
+from fastapi import Request, Response
+
+# Clients must revalidate every time, but may keep the body and send If-None-Match
+REVALIDATE = "private, no-cache"
+
+
+def make_etag(*parts) -> str:
+    """Strong ETag over the inputs that fully determine a response body."""
+    digest = hashlib.blake2b("|".join(map(str, parts)).encode(), digest_size=12).hexdigest()
+    return f'"{digest}"'
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    # If-None-Match uses weak comparison, so W/"x" matches "x"
+    return any(tag.strip().removeprefix("W/") == etag for tag in header.split(","))
+
+
+def not_modified(etag: str, cache_control: str = REVALIDATE) -> Response:
+    return Response(status_code=304, headers={"ETag": etag, "Cache-Control": cache_control})
+
+
+def tag_response(response: Response, etag: str, cache_control: str = REVALIDATE) -> Response:
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = cache_control
+    return response
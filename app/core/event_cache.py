@@ -0,0 +1,53 @@
+# app/core/event_cache.py
+from uuid import UUID
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.core.invalidation import invalidation_bus
+from app.db.session import AsyncSessionLocal
+from app.models.event import Event
+
+
+class EventCache:
+    """Read-through cache of Event rows for permission and status checks.
+
+    Cached instances are detached and shared between requests: treat them as read-only.
+    Handlers that modify an event load it with `db.get` and call `invalidate` after committing;
+    other workers drop their copy when the invalidation reaches them.
+    """
+
+    def __init__(self, maxsize: int, ttl_seconds: float):
+        self._cache = TTLCache(maxsize, ttl_seconds)
+
+    async def get(self, db: AsyncSession, event_id: UUID) -> Event | None:
+        event = self._cache.get(event_id)
+        if event is None and db.info.get("replica"):
+            # Shared by every request until it expires, so fill it from the primary, never from a lagging replica
+            async with AsyncSessionLocal() as primary:
+                return await self.get(primary, event_id)
+        if event is None:
+            event = await db.get(Event, event_id)
+            if event is None:
+                return None
+            db.expunge(event)
+            self._cache.set(event_id, event)
+        return event
+
+    def invalidate(self, event_id: UUID) -> None:
+        self._cache.invalidate(event_id)
+        invalidation_bus.publish("event", event_id.hex)
+
+    def _forget(self, event_id_hex: str) -> None:
+        self._cache.invalidate(UUID(hex=event_id_hex))
+
+    def clear(self) -> None:
+        self._cache.clear()
+
+    def stats(self) -> dict:
+        return self._cache.stats()
+
+
+event_cache = EventCache(settings.EVENT_CACHE_SIZE, settings.EVENT_CACHE_TTL_SECONDS)
+invalidation_bus.register("event", event_cache._forget, event_cache.clear)
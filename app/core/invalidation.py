@@ -0,0 +1,40 @@
+# app/core/invalidation.py
+from typing import Callable
+
+
+class InvalidationBus:
+    """Carries cache invalidations to the other workers.
+
+    Each process-local cache registers how to apply an invalidation by name, and how to drop
+    everything. `publish` applies nothing itself: the cache has already invalidated locally, and
+    the sender (the LISTEN/NOTIFY connection, app/live/notify.py) tells the other workers, who
+    call `apply`. Without a sender (single worker, notify disabled) publishing is a no-op.
+    """
+
+    def __init__(self):
+        self._handlers: dict[str, tuple[Callable[..., None], Callable[[], None]]] = {}
+        self._sender: Callable[[str, list], None] | None = None
+
+    def register(self, name: str, apply: Callable[..., None], reset: Callable[[], None]) -> None:
+        self._handlers[name] = (apply, reset)
+
+    def attach(self, sender: Callable[[str, list], None] | None) -> None:
+        self._sender = sender
+
+    def publish(self, name: str, *args) -> None:
+        # Arguments travel as JSON, so only strings and numbers
+        if self._sender is not None:
+            self._sender(name, list(args))
+
+    def apply(self, name: str, args: list) -> None:
+        handler = self._handlers.get(name)
+        if handler is not None:
+            handler[0](*args)
+
+    def reset_all(self) -> None:
+        """Drop every registered cache, e.g. after invalidations may have been missed."""
+        for _, reset in self._handlers.values():
+            reset()
+
+
+invalidation_bus = InvalidationBus()
@@ -0,0 +1,260 @@
+# app/core/metrics.py
+import logging
+import time
+from bisect import bisect_left
+from collections import Counter, defaultdict
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.config import settings
+from app.db.pool import describe_pool
+
+logger = logging.getLogger(__name__)
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+QUERY_COUNT_BUCKETS = (0, 1, 2, 3, 5, 10, 20, 50, 100, 250)
+UNMATCHED_ROUTE = "<unmatched>"
+
+
+class Histogram:
+    """Cumulative-bucket histogram in the Prometheus sense: counts per upper bound, plus sum and count."""
+
+    def __init__(self, buckets: tuple[float, ...]):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def lines(self, name: str, labels: str) -> list[str]:
+        out, running = [], 0
+        for bound, count in zip((*map(_number, self.buckets), "+Inf"), self.counts):
+            running += count
+            out.append(f'{name}_bucket{{{labels},le="{bound}"}} {running}')
+        out.append(f"{name}_sum{{{labels}}} {_number(self.sum)}")
+        out.append(f"{name}_count{{{labels}}} {self.count}")
+        return out
+
+
+@dataclass
+class RequestQueries:
+    """SQL issued while serving one request, filled in by the engine hooks."""
+
+    count: int = 0
+    seconds: float = 0.0
+    # (statement, seconds), only kept when the slow-request log is on
+    statements: list[tuple[str, float]] | None = None
+
+
+_current_request: ContextVar[RequestQueries | None] = ContextVar("current_request", default=None)
+
+
+@dataclass
+class RouteMetrics:
+    statuses: defaultdict[int, int] = field(default_factory=lambda: defaultdict(int))
+    latency: Histogram = field(default_factory=lambda: Histogram(LATENCY_BUCKETS))
+    queries: Histogram = field(default_factory=lambda: Histogram(QUERY_COUNT_BUCKETS))
+    db_time: Histogram = field(default_factory=lambda: Histogram(LATENCY_BUCKETS))
+
+
+class Metrics:
+    """Per-route request metrics and per-engine query totals for this worker process.
+
+    Each worker keeps its own numbers; Prometheus scrapes every worker and sums them.
+    """
+
+    def __init__(self, slow_request_seconds: float | None, slow_request_max_queries: int):
+        self.slow_request_seconds = slow_request_seconds
+        self.slow_request_max_queries = slow_request_max_queries
+        self.routes: defaultdict[tuple[str, str], RouteMetrics] = defaultdict(RouteMetrics)
+        self.engines: dict[str, AsyncEngine] = {}
+        self.engine_queries: defaultdict[str, int] = defaultdict(int)
+        self.engine_seconds: defaultdict[str, float] = defaultdict(float)
+        self.slow_requests = 0
+        # Scopes of requests being served, by id; their route is read when rendering
+        self.active: dict[int, Scope] = {}
+
+    def instrument_engine(self, engine: AsyncEngine, name: str) -> None:
+        """Count every statement run on `engine`, and attribute it to the request being served, if any."""
+        self.engines[name] = engine
+        sync_engine = engine.sync_engine
+
+        @event.listens_for(sync_engine, "before_cursor_execute")
+        def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+            conn.info.setdefault("query_started", []).append(time.perf_counter())
+
+        @event.listens_for(sync_engine, "after_cursor_execute")
+        def after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+            self._record_query(name, statement, time.perf_counter() - conn.info["query_started"].pop())
+
+        @event.listens_for(sync_engine, "handle_error")
+        def handle_error(context):
+            started = context.connection.info.get("query_started") if context.connection is not None else None
+            if started:
+                self._record_query(name, context.statement, time.perf_counter() - started.pop())
+
+    def _record_query(self, engine_name: str, statement: str | None, seconds: float) -> None:
+        self.engine_queries[engine_name] += 1
+        self.engine_seconds[engine_name] += seconds
+        queries = _current_request.get()
+        if queries is None:
+            return
+        queries.count += 1
+        queries.seconds += seconds
+        if queries.statements is not None and len(queries.statements) < self.slow_request_max_queries:
+            queries.statements.append((statement or "", seconds))
+
+    def start_request(self) -> RequestQueries:
+        return RequestQueries(statements=[] if self.slow_request_seconds is not None else None)
+
+    def finish_request(self, method: str, route: str, status: int, seconds: float, queries: RequestQueries, streamed: bool) -> None:
+        metrics = self.routes[method, route]
+        metrics.statuses[status] += 1
+        metrics.queries.observe(queries.count)
+        metrics.db_time.observe(queries.seconds)
+        # An SSE response lasts as long as the viewer stays; its duration isn't a latency
+        if not streamed:
+            metrics.latency.observe(seconds)
+        if self.slow_request_seconds is not None and seconds >= self.slow_request_seconds and not streamed:
+            self.slow_requests += 1
+            self._log_slow(method, route, status, seconds, queries)
+
+    def _log_slow(self, method: str, route: str, status: int, seconds: float, queries: RequestQueries) -> None:
+        lines = [
+            f"  {elapsed * 1000:8.2f} ms  {' '.join(statement.split())[:500]}"
+            for statement, elapsed in queries.statements or []
+        ]
+        if queries.count > len(lines):
+            lines.append(f"  ... {queries.count - len(lines)} more")
+        logger.warning(
+            "Slow request %s %s -> %d in %.1f ms, %d queries, %.1f ms in the database\n%s",
+            method, route, status, seconds * 1000, queries.count, queries.seconds * 1000, "\n".join(lines),
+        )
+
+    def render(self) -> str:
+        """All metrics in the Prometheus text exposition format."""
+        out = [
+            "# HELP eventpulse_http_requests_total Requests served, by route template and status.",
+            "# TYPE eventpulse_http_requests_total counter",
+        ]
+        routes = sorted(self.routes.items())
+        for (method, route), metrics in routes:
+            for status, count in sorted(metrics.statuses.items()):
+                out.append(f'eventpulse_http_requests_total{{{_labels(method, route)},status="{status}"}} {count}')
+
+        out += [
+            "# HELP eventpulse_http_requests_in_flight Requests currently being served.",
+            "# TYPE eventpulse_http_requests_in_flight gauge",
+        ]
+        in_flight = Counter((scope["method"], route_template(scope)) for scope in list(self.active.values()))
+        out += [
+            f"eventpulse_http_requests_in_flight{{{_labels(*key)}}} {in_flight[key]}"
+            for key in sorted(in_flight.keys() | self.routes.keys())
+        ]
+
+        for name, help_text, attr in (
+            ("eventpulse_http_request_duration_seconds", "Time to serve a request, streamed responses excluded.", "latency"),
+            ("eventpulse_http_request_db_queries", "SQL statements issued per request.", "queries"),
+            ("eventpulse_http_request_db_seconds", "Time spent in SQL statements per request.", "db_time"),
+        ):
+            out += [f"# HELP {name} {help_text}", f"# TYPE {name} histogram"]
+            for key, metrics in routes:
+                out += getattr(metrics, attr).lines(name, _labels(*key))
+
+        out += [
+            "# HELP eventpulse_slow_requests_total Requests over the slow-request threshold.",
+            "# TYPE eventpulse_slow_requests_total counter",
+            f"eventpulse_slow_requests_total {self.slow_requests}",
+            "# HELP eventpulse_db_queries_total SQL statements run, in requests and background tasks.",
+            "# TYPE eventpulse_db_queries_total counter",
+            *(f'eventpulse_db_queries_total{{database="{name}"}} {count}' for name, count in sorted(self.engine_queries.items())),
+            "# HELP eventpulse_db_query_seconds_total Time spent in SQL statements.",
+            "# TYPE eventpulse_db_query_seconds_total counter",
+            *(f'eventpulse_db_query_seconds_total{{database="{name}"}} {_number(seconds)}' for name, seconds in sorted(self.engine_seconds.items())),
+        ]
+
+        pools = {name: describe_pool(engine.pool) for name, engine in self.engines.items()}
+        for name, key, kind, help_text in (
+            ("eventpulse_db_pool_checked_out", "checked_out", "gauge", "Connections in use."),
+            ("eventpulse_db_pool_size", "size", "gauge", "Configured pool size."),
+            ("eventpulse_db_pool_checkouts_total", "checkouts", "counter", "Connections handed out by the pool."),
+            ("eventpulse_db_pool_checkout_timeouts_total", "checkout_timeouts", "counter", "Checkouts that gave up waiting."),
+            ("eventpulse_db_pool_wait_seconds_total", "wait_seconds_total", "counter", "Time spent waiting for a connection."),
+        ):
+            out += [f"# HELP {name} {help_text}", f"# TYPE {name} {kind}"]
+            out += [f'{name}{{database="{db}"}} {_number(stats[key])}' for db, stats in pools.items() if key in stats]
+        return "\n".join(out) + "\n"
+
+
+class MetricsMiddleware:
+    """Times every HTTP request and labels it with the matched route template, not the raw path."""
+
+    def __init__(self, app: ASGIApp, metrics: Metrics):
+        self.app = app
+        self.metrics = metrics
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        self.metrics.active[id(scope)] = scope
+        queries = self.metrics.start_request()
+        token = _current_request.set(queries)
+        status = 500
+        streamed = False
+        start = time.perf_counter()
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status, streamed
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                streamed = any(name == b"content-type" and value.startswith(b"text/event-stream") for name, value in message.get("headers", ()))
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            _current_request.reset(token)
+            del self.metrics.active[id(scope)]
+            self.metrics.finish_request(
+                scope["method"], route_template(scope), status, time.perf_counter() - start, queries, streamed,
+            )
+
+
+def route_template(scope: Scope) -> str:
+    """Template of the route that served `scope`, e.g. /events/{event_id}/summary, which keeps labels bounded."""
+    route = scope.get("route")
+    if route is None or not hasattr(route, "path_regex"):
+        return UNMATCHED_ROUTE
+    # Routes from an included router carry their path without the router's prefix. Try the tails of
+    # the request path that start at a "/", longest first; the first one the route's regex matches
+    # is the part the route served, and whatever precedes it is the prefix to put back
+    path = scope["path"]
+    for index, char in enumerate(path):
+        if char == "/" and route.path_regex.match(path[index:]):
+            return path[:index] + route.path
+    return route.path
+
+
+def _labels(method: str, route: str) -> str:
+    route = route.replace("\\", "\\\\").replace('"', '\\"')
+    return f'method="{method}",route="{route}"'
+
+
+def _number(value: float) -> str:
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+metrics = Metrics(
+    slow_request_seconds=settings.SLOW_REQUEST_MS / 1000 if settings.SLOW_REQUEST_MS is not None else None,
+    slow_request_max_queries=settings.SLOW_REQUEST_MAX_QUERIES,
+)
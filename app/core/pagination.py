@@ -0,0 +1,103 @@
+# app/core/pagination.py
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from uuid import UUID
+
+from fastapi import HTTPException, Query
+from sqlalchemy import select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.event import Event
+
+EPOCH = datetime(1970, 1, 1)
+EVENT_PAGE_SIZE = 25
+EVENT_PAGE_MAX = 200
+
+
+@dataclass(frozen=True)
+class EventCursor:
+    # (datetime, id) of the last event on the previous page; pages run newest first.
+    datetime: datetime
+    id: UUID
+
+    def encode(self) -> str:
+        micros = (self.datetime - EPOCH) // timedelta(microseconds=1)
+        return f"{micros}-{self.id.hex}"
+
+    @classmethod
+    def decode(cls, value: str) -> "EventCursor | None":
+        try:
+            micros, id_hex = value.split("-", 1)
+            return cls(EPOCH + timedelta(microseconds=int(micros)), UUID(hex=id_hex))
+        except ValueError:
+            return None
+
+
+@dataclass(frozen=True)
+class EventFilters:
+    status: str | None = None
+    date_from: date | None = None
+    date_to: date | None = None
+
+    def query_params(self) -> dict[str, str]:
+        params = {"status": self.status, "date_from": self.date_from, "date_to": self.date_to}
+        return {key: str(value) for key, value in params.items() if value}
+
+
+EVENT_STATUSES = ("Scheduled", "Live", "Closed")
+
+
+def _parse_date(value: str | None) -> date | None:
+    if not value:
+        return None
+    try:
+        return date.fromisoformat(value)
+    except ValueError:
+        raise HTTPException(status_code=400, detail=f"Invalid date: {value}")
+
+
+def event_filters(
+    status: str | None = Query(None),
+    date_from: str | None = Query(None),
+    date_to: str | None = Query(None),
+) -> EventFilters:
+    # Plain strings so the dashboard's filter form can submit its empty "any" values
+    if status and status not in EVENT_STATUSES:
+        raise HTTPException(status_code=400, detail=f"Invalid status: {status}")
+    return EventFilters(status or None, _parse_date(date_from), _parse_date(date_to))
+
+
+def event_cursor(cursor: str | None = Query(None)) -> EventCursor | None:
+    if not cursor:
+        return None
+    decoded = EventCursor.decode(cursor)
+    if decoded is None:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    return decoded
+
+
+async def host_events_page(
+    db: AsyncSession,
+    host_id: UUID,
+    filters: EventFilters,
+    cursor: EventCursor | None = None,
+    limit: int = EVENT_PAGE_SIZE,
+) -> tuple[list[Event], EventCursor | None]:
+    """One page of a host's events, newest first, plus the cursor for the next page (None on the last)."""
+    # Served by ix_events_host_id_datetime_id, or ix_events_host_id_status_datetime_id when filtering by status
+    query = select(Event).where(Event.host_id == host_id)
+    if filters.status:
+        query = query.where(Event.status == filters.status)
+    if filters.date_from:
+        query = query.where(Event.datetime >= datetime.combine(filters.date_from, datetime.min.time()))
+    if filters.date_to:
+        query = query.where(Event.datetime < datetime.combine(filters.date_to + timedelta(days=1), datetime.min.time()))
+    if cursor:
+        query = query.where(tuple_(Event.datetime, Event.id) < (cursor.datetime, cursor.id))
+    query = query.order_by(Event.datetime.desc(), Event.id.desc()).limit(limit + 1)
+
+    events = list((await db.execute(query)).scalars().all())
+    if len(events) <= limit:
+        return events, None
+    events = events[:limit]
+    return events, EventCursor(events[-1].datetime, events[-1].id)
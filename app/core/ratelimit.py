@@ -0,0 +1,107 @@
+# app/core/ratelimit.py
+import math
+import time
+from abc import ABC, abstractmethod
+from collections import Counter
+from dataclasses import dataclass
+from typing import Hashable
+
+from fastapi import Depends, HTTPException, Request
+
+from app.core.config import settings
+from app.models.user import User
+from app.users import current_active_user
+
+
+@dataclass(frozen=True)
+class RateLimit:
+    # Bucket of `capacity` tokens that refills completely every `period` seconds
+    capacity: int
+    period: float
+
+    @property
+    def rate(self) -> float:
+        return self.capacity / self.period
+
+    @classmethod
+    def parse(cls, value: str) -> "RateLimit":
+        """Parse "<count>/<seconds>s", e.g. "20/10s" allows bursts of 20 and 2 requests/s sustained."""
+        count, _, period = value.partition("/")
+        return cls(capacity=int(count), period=float(period.rstrip("s") or 1))
+
+
+class RateLimitBackend(ABC):
+    """Where bucket state lives. In-memory is per worker; a shared store (e.g. Redis) can implement the same call."""
+
+    @abstractmethod
+    async def hit(self, key: Hashable, limit: RateLimit) -> float:
+        """Take one token. Returns 0 if allowed, otherwise seconds until a token is available."""
+
+
+class InMemoryTokenBucketBackend(RateLimitBackend):
+    def __init__(self, max_keys: int = 100_000):
+        self.max_keys = max_keys
+        # key -> (tokens, last update, refill period)
+        self._buckets: dict[Hashable, tuple[float, float, float]] = {}
+
+    async def hit(self, key: Hashable, limit: RateLimit) -> float:
+        now = time.monotonic()
+        tokens, updated, _ = self._buckets.get(key, (limit.capacity, now, limit.period))
+        tokens = min(limit.capacity, tokens + (now - updated) * limit.rate)
+        if tokens >= 1:
+            self._buckets[key] = (tokens - 1, now, limit.period)
+            if len(self._buckets) > self.max_keys:
+                self._prune(now)
+            return 0.0
+        self._buckets[key] = (tokens, now, limit.period)
+        return (1 - tokens) / limit.rate
+
+    def _prune(self, now: float) -> None:
+        # Buckets idle for a full period have refilled and carry no state worth keeping
+        stale = [key for key, (_, updated, period) in self._buckets.items() if now - updated >= period]
+        for key in stale:
+            del self._buckets[key]
+        while len(self._buckets) > self.max_keys:
+            self._buckets.pop(next(iter(self._buckets)))
+
+
+class RateLimiter:
+    def __init__(self, backend: RateLimitBackend, limits: dict[str, RateLimit], enabled: bool = True):
+        self.backend = backend
+        self.limits = limits
+        self.enabled = enabled
+        self.allowed: Counter = Counter()
+        self.shed: Counter = Counter()
+
+    def __call__(self, route: str):
+        """Dependency limiting `route` per (user, event, route)."""
+        limit = self.limits.get(route)
+
+        async def check(request: Request, user: User = Depends(current_active_user)) -> None:
+            if not self.enabled or limit is None:
+                return
+            key = (user.id, request.path_params.get("event_id"), route)
+            retry_after = await self.backend.hit(key, limit)
+            if retry_after:
+                self.shed[route] += 1
+                raise HTTPException(
+                    status_code=429,
+                    detail="Too many requests, slow down",
+                    headers={"Retry-After": str(max(1, math.ceil(retry_after)))},
+                )
+            self.allowed[route] += 1
+
+        return check
+
+    def stats(self) -> dict:
+        return {
+            route: {"limit": f"{limit.capacity}/{limit.period:g}s", "allowed": self.allowed[route], "shed": self.shed[route]}
+            for route, limit in self.limits.items()
+        }
+
+
+rate_limit = RateLimiter(
+    InMemoryTokenBucketBackend(),
+    {route: RateLimit.parse(value) for route, value in settings.RATE_LIMITS.items()},
+    enabled=settings.RATE_LIMIT_ENABLED,
+)
@@ -0,0 +1,38 @@
+# app/core/templates.py
+from pathlib import Path
+
+import jinja2
+from fastapi.templating import Jinja2Templates
+
+from app.core.config import settings
+
+TEMPLATE_DIR = Path(__file__).resolve().parents[1] / "templates"
+
+
+def _environment() -> jinja2.Environment:
+    bytecode_cache = None
+    if settings.TEMPLATE_BYTECODE_CACHE_DIR:
+        # Shared by all workers; Jinja writes each entry to a temp file and renames it into place
+        cache_dir = Path(settings.TEMPLATE_BYTECODE_CACHE_DIR)
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        bytecode_cache = jinja2.FileSystemBytecodeCache(str(cache_dir))
+    return jinja2.Environment(
+        loader=jinja2.FileSystemLoader(TEMPLATE_DIR),
+        autoescape=jinja2.select_autoescape(),
+        # Without auto-reload a compiled template is used as is, with no stat() per render
+        auto_reload=settings.TEMPLATE_AUTO_RELOAD,
+        bytecode_cache=bytecode_cache,
+        cache_size=-1,
+    )
+
+
+# One environment for every router, so each template is compiled once per worker
+templates = Jinja2Templates(env=_environment())
+
+
+def precompile_templates() -> int:
+    """Load every template so the first requests don't pay for compiling them. Returns how many."""
+    names = templates.env.list_templates(extensions=["html"])
+    for name in names:
+        templates.env.get_template(name)
+    return len(names)
@@ -0,0 +1,86 @@
+# app/db/pool.py
+import asyncio
+import time
+from dataclasses import dataclass
+
+from sqlalchemy import exc, text
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+
+@dataclass
+class PoolStats:
+    checkouts: int = 0
+    timeouts: int = 0
+    wait_seconds_total: float = 0.0
+    wait_seconds_max: float = 0.0
+
+    def record_wait(self, seconds: float) -> None:
+        self.checkouts += 1
+        self.wait_seconds_total += seconds
+        self.wait_seconds_max = max(self.wait_seconds_max, seconds)
+
+
+# Module level so the numbers survive engine.dispose(), which recreates the pool object
+pool_stats = PoolStats()
+replica_pool_stats = PoolStats()
+
+
+class InstrumentedQueuePool(AsyncAdaptedQueuePool):
+    stats = pool_stats
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except exc.TimeoutError:
+            self.stats.timeouts += 1
+            raise
+        self.stats.record_wait(time.perf_counter() - start)
+        return connection
+
+
+class InstrumentedReplicaQueuePool(InstrumentedQueuePool):
+    stats = replica_pool_stats
+
+
+def describe_pool(pool) -> dict:
+    pool_stats = getattr(pool, "stats", PoolStats())
+    stats = {
+        "checkouts": pool_stats.checkouts,
+        "checkout_timeouts": pool_stats.timeouts,
+        "wait_seconds_total": round(pool_stats.wait_seconds_total, 6),
+        "wait_seconds_max": round(pool_stats.wait_seconds_max, 6),
+        "wait_seconds_avg": round(pool_stats.wait_seconds_total / pool_stats.checkouts, 6) if pool_stats.checkouts else 0.0,
+    }
+    if isinstance(pool, AsyncAdaptedQueuePool):
+        stats.update({
+            "size": pool.size(),
+            "checked_out": pool.checkedout(),
+            "checked_in": pool.checkedin(),
+            "overflow": pool.overflow(),
+            "max_overflow": pool._max_overflow,
+            "timeout": pool.timeout(),
+        })
+    return stats
+
+
+async def prewarm_pool(engine: AsyncEngine, connections: int) -> int:
+    """Open up to `connections` pool connections at once and return them to the pool, so the first requests skip connecting."""
+    pool = engine.pool
+    if isinstance(pool, AsyncAdaptedQueuePool):
+        # Anything beyond pool_size would be overflow, which is closed as soon as it is returned
+        connections = min(connections, pool.size())
+    if connections <= 0:
+        return 0
+    # All held open together, so each one is a separate connection
+    results = await asyncio.gather(*(engine.connect() for _ in range(connections)), return_exceptions=True)
+    opened = [conn for conn in results if not isinstance(conn, BaseException)]
+    try:
+        await asyncio.gather(*(conn.execute(text("SELECT 1")) for conn in opened))
+    finally:
+        await asyncio.gather(*(conn.close() for conn in opened))
+    errors = [result for result in results if isinstance(result, BaseException)]
+    if errors:
+        raise errors[0]
+    return len(opened)
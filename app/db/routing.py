@@ -0,0 +1,63 @@
+# app/db/routing.py
+import time
+
+from fastapi import Request
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.db.session import AsyncSessionLocal, ReplicaSessionLocal
+
+# Holds the time until which this client reads from the primary
+READ_YOUR_WRITES_COOKIE = "eventpulse_primary_until"
+SAFE_METHODS = {"GET", "HEAD", "OPTIONS"}
+
+
+def pinned_to_primary(request: Request) -> bool:
+    try:
+        return float(request.cookies.get(READ_YOUR_WRITES_COOKIE, 0)) > time.time()
+    except ValueError:
+        return False
+
+
+async def get_read_db(request: Request):
+    """Session for read-only endpoints: the replica, unless none is configured or the client wrote recently."""
+    use_replica = ReplicaSessionLocal is not None and not pinned_to_primary(request)
+    request.state.db_route = "replica" if use_replica else "primary"
+    async with (ReplicaSessionLocal if use_replica else AsyncSessionLocal)() as session:
+        yield session
+
+
+class ReadYourWritesMiddleware:
+    """Pins a client to the primary for a while after any successful write, via a cookie.
+
+    The cookie travels with the client, so the pin holds whichever worker serves the next read.
+    Responses also say which database served them in X-DB-Route.
+    """
+
+    def __init__(self, app: ASGIApp, window_seconds: float):
+        self.app = app
+        self.window_seconds = window_seconds
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or ReplicaSessionLocal is None:
+            await self.app(scope, receive, send)
+            return
+
+        is_write = scope["method"] not in SAFE_METHODS
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                headers = MutableHeaders(scope=message)
+                route = scope.get("state", {}).get("db_route")
+                if route:
+                    headers["X-DB-Route"] = route
+                if is_write and message["status"] < 400:
+                    until = time.time() + self.window_seconds
+                    headers.append(
+                        "Set-Cookie",
+                        f"{READ_YOUR_WRITES_COOKIE}={until:.3f}; Max-Age={int(self.window_seconds) + 1}; Path=/; HttpOnly; SameSite=Lax",
+                    )
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
+
@@ -0,0 +1,32 @@
+# app/db/schema.py
+from pathlib import Path
+
+from alembic.config import Config
+from alembic.runtime.migration import MigrationContext
+from alembic.script import ScriptDirectory
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+ALEMBIC_INI = Path(__file__).resolve().parents[2] / "alembic.ini"
+
+
+class SchemaVersionError(RuntimeError):
+    pass
+
+
+def expected_heads() -> set[str]:
+    script = ScriptDirectory.from_config(Config(str(ALEMBIC_INI)))
+    return set(script.get_heads())
+
+
+async def check_schema_version(engine: AsyncEngine) -> str:
+    """Fail fast when the database is not at the migration head; DDL is left to `alembic upgrade head`."""
+    async with engine.connect() as conn:
+        current = set(await conn.run_sync(lambda sync_conn: MigrationContext.configure(sync_conn).get_current_heads()))
+
+    expected = expected_heads()
+    if current != expected:
+        raise SchemaVersionError(
+            f"Database schema is at {sorted(current) or 'no revision'}, expected {sorted(expected)}. "
+            "Run `alembic upgrade head` before starting the app."
+        )
+    return ",".join(sorted(current))
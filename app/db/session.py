@@ -2,8 +2,55 @@ from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from sqlalchemy.orm import sessionmaker
 
 from app.core.config import settings
+from app.db.pool import InstrumentedQueuePool, InstrumentedReplicaQueuePool
 
-DATABASE_URL = settings.DATABASE_URL.replace("postgresql+psycopg2", "postgresql+asyncpg")
 
-engine = create_async_engine(DATABASE_URL, future=True, echo=True)
+def async_url(url: str) -> str:
+    return url.replace("postgresql+psycopg2", "postgresql+asyncpg")
+
+
+DATABASE_URL = async_url(settings.DATABASE_URL)
+REPLICA_URL = async_url(settings.DATABASE_REPLICA_URL) if settings.DATABASE_REPLICA_URL else None
+
+ENGINE_PROFILES = {
+    "dev": {"echo": True, "pool_size": 5, "max_overflow": 10, "pool_timeout": 30, "pool_recycle": -1, "pool_pre_ping": True, "statement_cache_size": 100},
+    "prod": {"echo": False, "pool_size": 20, "max_overflow": 10, "pool_timeout": 10, "pool_recycle": 1800, "pool_pre_ping": True, "statement_cache_size": 500},
+    "bench": {"echo": False, "pool_size": 50, "max_overflow": 0, "pool_timeout": 5, "pool_recycle": -1, "pool_pre_ping": False, "statement_cache_size": 500},
+}
+
+
+def engine_options() -> dict:
+    options = dict(ENGINE_PROFILES[settings.DB_PROFILE])
+    overrides = {
+        "echo": settings.DB_ECHO,
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+        "pool_pre_ping": settings.DB_POOL_PRE_PING,
+        "statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE,
+    }
+    options.update({key: value for key, value in overrides.items() if value is not None})
+
+    statement_cache_size = options.pop("statement_cache_size")
+    options["connect_args"] = {
+        # asyncpg's own cache and SQLAlchemy's prepared statement cache on top of it
+        "statement_cache_size": statement_cache_size,
+        "prepared_statement_cache_size": statement_cache_size,
+    }
+    return options
+
+
+engine = create_async_engine(DATABASE_URL, future=True, poolclass=InstrumentedQueuePool, **engine_options())
 AsyncSessionLocal = sessionmaker(engine, expire_on_commit=False, class_=AsyncSession)
+
+# Optional read replica for read-only endpoints, see app/db/routing.py. Sessions on it are
+# tagged so shared caches can refuse to fill from possibly stale rows.
+replica_engine = (
+    create_async_engine(REPLICA_URL, future=True, poolclass=InstrumentedReplicaQueuePool, **engine_options())
+    if REPLICA_URL else None
+)
+ReplicaSessionLocal = (
+    sessionmaker(replica_engine, expire_on_commit=False, class_=AsyncSession, info={"replica": True})
+    if replica_engine else None
+)
@@ -0,0 +1,72 @@
+# app/live/broadcast.py
+import asyncio
+from collections import defaultdict
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import datetime
+from uuid import UUID
+
+
+@dataclass(frozen=True)
+class FeedbackMessage:
+    # "created" for new feedback, "updated" for pin/flag toggles
+    kind: str
+    id: UUID
+    event_id: UUID
+    emoji: str
+    comment: str | None
+    timestamp: datetime
+    pinned: bool = False
+    flagged: bool = False
+
+    @classmethod
+    def from_feedback(cls, kind: str, feedback) -> "FeedbackMessage":
+        return cls(
+            kind=kind,
+            id=feedback.id,
+            event_id=feedback.event_id,
+            emoji=feedback.emoji,
+            comment=feedback.comment,
+            timestamp=feedback.timestamp,
+            pinned=bool(feedback.pinned),
+            flagged=bool(feedback.flagged),
+        )
+
+
+class FeedbackBroadcaster:
+    """In-process fan-out of feedback messages to the live subscribers of each event.
+
+    Rooms with no subscribers hold no state, so publishing into an idle event is a dict lookup.
+    """
+
+    def __init__(self, queue_size: int = 100):
+        self.queue_size = queue_size
+        self._subscribers: dict[UUID, set[asyncio.Queue]] = defaultdict(set)
+
+    def subscriber_count(self, event_id: UUID) -> int:
+        return len(self._subscribers.get(event_id, ()))
+
+    @contextmanager
+    def subscribe(self, event_id: UUID):
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.queue_size)
+        self._subscribers[event_id].add(queue)
+        try:
+            yield queue
+        finally:
+            subscribers = self._subscribers.get(event_id)
+            if subscribers is not None:
+                subscribers.discard(queue)
+                if not subscribers:
+                    del self._subscribers[event_id]
+
+    def publish(self, message: FeedbackMessage) -> None:
+        for queue in tuple(self._subscribers.get(message.event_id, ())):
+            try:
+                queue.put_nowait(message)
+            except asyncio.QueueFull:
+                # A client that stopped reading should not hold up the room. It misses this push;
+                # its next delta poll still returns the row, since pushes never advance the cursor.
+                pass
+
+
+feedback_broadcaster = FeedbackBroadcaster()
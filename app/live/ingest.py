@@ -0,0 +1,217 @@
+# app/live/ingest.py
+import asyncio
+import json
+import logging
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from uuid import UUID
+
+from sqlalchemy import insert
+from sqlalchemy.exc import IntegrityError
+
+from app.analytics import rollups, summary
+from app.core.config import settings
+from app.db.session import AsyncSessionLocal
+from app.live.broadcast import FeedbackMessage
+from app.live.notify import apply_message, feedback_notifier
+from app.models.feedback import Feedback
+
+logger = logging.getLogger(__name__)
+
+_STOP = object()
+
+
+@dataclass(frozen=True)
+class PendingFeedback:
+    id: UUID
+    event_id: UUID
+    user_id: UUID
+    emoji: str
+    comment: str | None
+    timestamp: datetime
+    pinned: bool = False
+    flagged: bool = False
+
+
+class IngestQueueFull(Exception):
+    pass
+
+
+def announce_feedback(feedback) -> None:
+    # Everything that follows a committed feedback row in this worker, whichever path wrote it;
+    # other workers do the same when the NOTIFY sent with the row reaches them
+    apply_message(FeedbackMessage.from_feedback("created", feedback))
+
+
+class FeedbackIngestor:
+    """Write-behind queue for feedback: rows are accepted immediately and flushed in multi-row INSERTs."""
+
+    def __init__(self, enabled: bool, max_rows: int, interval_ms: int, queue_size: int, shutdown_retries: int, max_backoff_seconds: float):
+        self.enabled = enabled
+        self.max_rows = max_rows
+        self.interval = interval_ms / 1000
+        self.queue_size = queue_size
+        self.shutdown_retries = shutdown_retries
+        self.max_backoff = max_backoff_seconds
+        self.accepted = 0
+        self.rejected = 0
+        self.flushed = 0
+        self.dropped = 0
+        self.batches = 0
+        self.retries = 0
+        self.lost = 0
+        self._queue: asyncio.Queue | None = None
+        self._task: asyncio.Task | None = None
+        self._closing = False
+
+    def submit(self, row: PendingFeedback) -> None:
+        if self._queue is None or self._closing:
+            raise IngestQueueFull("Feedback ingestion is not running")
+        try:
+            self._queue.put_nowait(row)
+        except asyncio.QueueFull:
+            self.rejected += 1
+            raise IngestQueueFull("Feedback queue is full")
+        self.accepted += 1
+
+    async def start(self) -> None:
+        if not self.enabled or self._task is not None:
+            return
+        self._closing = False
+        self._queue = asyncio.Queue(maxsize=self.queue_size)
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop accepting rows and flush everything already queued."""
+        if self._task is None:
+            return
+        self._closing = True
+        await self._queue.put(_STOP)
+        await self._task
+        self._task = None
+        self._queue = None
+
+    async def flush(self) -> None:
+        """Wait until every row queued in this worker so far has been written."""
+        if self._queue is None or self._closing:
+            return
+        waiter = asyncio.get_running_loop().create_future()
+        await self._queue.put(waiter)
+        await waiter
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        stopping = False
+        while not stopping:
+            item = await self._queue.get()
+            if item is _STOP:
+                return
+            batch, waiter = [], None
+            deadline = loop.time() + self.interval
+            while True:
+                if isinstance(item, asyncio.Future):
+                    # A flush() call: write what came before it now
+                    waiter = item
+                    break
+                batch.append(item)
+                timeout = deadline - loop.time()
+                if len(batch) >= self.max_rows or timeout <= 0:
+                    break
+                try:
+                    item = await asyncio.wait_for(self._queue.get(), timeout)
+                except asyncio.TimeoutError:
+                    break
+                if item is _STOP:
+                    stopping = True
+                    break
+            if batch:
+                await self._flush(batch)
+            if waiter is not None:
+                waiter.set_result(None)
+
+    async def _flush(self, batch: list[PendingFeedback]) -> None:
+        try:
+            await self._write_with_retry(batch)
+        except IntegrityError:
+            # Usually an event deleted while its feedback was queued; salvage the rest row by row
+            written = []
+            for row in batch:
+                try:
+                    await self._write_with_retry([row])
+                    written.append(row)
+                except IntegrityError:
+                    self.dropped += 1
+                except Exception:
+                    self._log_unwritten([row])
+            batch = written
+        except Exception:
+            self._log_unwritten(batch)
+            return
+
+        self.batches += 1
+        self.flushed += len(batch)
+        for row in batch:
+            announce_feedback(row)
+
+    def _log_unwritten(self, rows: list[PendingFeedback]) -> None:
+        # Only reached while shutting down with the database still unavailable. The rows were
+        # acknowledged, so they are logged in full for replay rather than lost silently.
+        logger.exception("Could not write %d queued feedback rows; logging them for replay", len(rows))
+        for row in rows:
+            logger.error("Unwritten feedback: %s", json.dumps(asdict(row), default=str))
+        self.lost += len(rows)
+
+    async def _write_with_retry(self, batch: list[PendingFeedback]) -> None:
+        """Write the batch, retrying transient failures with capped exponential backoff.
+
+        The rows were already acknowledged, so while running this keeps trying: the queue fills up
+        meanwhile and new submissions get a 503 instead of being accepted. Once stopping, it gives
+        up after `shutdown_retries` attempts.
+        """
+        attempt = 0
+        while True:
+            try:
+                await self._write(batch)
+                return
+            except IntegrityError:
+                raise
+            except Exception:
+                attempt += 1
+                if self._closing and attempt > self.shutdown_retries:
+                    raise
+                self.retries += 1
+                delay = min(self.max_backoff, 0.1 * 2 ** attempt)
+                logger.warning("Feedback flush of %d rows failed (attempt %d); retrying in %.1fs", len(batch), attempt, delay, exc_info=True)
+                await asyncio.sleep(delay)
+
+    async def _write(self, rows: list[PendingFeedback]) -> None:
+        async with AsyncSessionLocal() as db:
+            await db.execute(insert(Feedback), [asdict(row) for row in rows])
+            await rollups.record_feedback_batch(db, [(row.event_id, row.emoji, row.timestamp) for row in rows])
+            await feedback_notifier.notify(db, [FeedbackMessage.from_feedback("created", row) for row in rows])
+            await summary.discard_snapshots(db, [row.event_id for row in rows])
+            await db.commit()
+
+    def stats(self) -> dict:
+        return {
+            "mode": "batched" if self.enabled else "direct",
+            "queued": self._queue.qsize() if self._queue else 0,
+            "queue_size": self.queue_size,
+            "accepted": self.accepted,
+            "rejected": self.rejected,
+            "flushed": self.flushed,
+            "dropped": self.dropped,
+            "batches": self.batches,
+            "retries": self.retries,
+            "lost": self.lost,
+        }
+
+
+feedback_ingestor = FeedbackIngestor(
+    enabled=settings.FEEDBACK_INGEST_MODE == "batched",
+    max_rows=settings.FEEDBACK_BATCH_MAX_ROWS,
+    interval_ms=settings.FEEDBACK_BATCH_INTERVAL_MS,
+    queue_size=settings.FEEDBACK_QUEUE_SIZE,
+    shutdown_retries=settings.FEEDBACK_FLUSH_SHUTDOWN_RETRIES,
+    max_backoff_seconds=settings.FEEDBACK_FLUSH_MAX_BACKOFF_SECONDS,
+)
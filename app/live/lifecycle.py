@@ -0,0 +1,146 @@
+# app/live/lifecycle.py
+import asyncio
+import logging
+from datetime import datetime, timedelta
+from uuid import UUID
+
+from sqlalchemy import func, select, update
+
+from app.analytics import summary
+from app.core.calendar_cache import calendar_cache
+from app.core.config import settings
+from app.core.event_cache import event_cache
+from app.db.session import AsyncSessionLocal
+from app.live.ingest import feedback_ingestor
+from app.models.event import Event
+
+logger = logging.getLogger(__name__)
+
+# Transaction-level advisory lock: one worker sweeps at a time, the others skip the round
+LIFECYCLE_LOCK_ID = 7_201_001
+
+
+class LifecycleScheduler:
+    """Moves events Scheduled -> Live at their start time and, if `close_after` is set, closes them that long after.
+
+    Only events that started within `start_window` go Live; older ones are left as they are.
+    """
+
+    def __init__(self, enabled: bool, interval_seconds: float, batch_size: int, start_window: timedelta, close_after: timedelta | None):
+        self.enabled = enabled
+        self.interval = interval_seconds
+        self.batch_size = batch_size
+        self.start_window = start_window
+        self.close_after = close_after
+        self.sweeps = 0
+        self.skipped = 0
+        self.started = 0
+        self.closed = 0
+        self.last_sweep: datetime | None = None
+        self._task: asyncio.Task | None = None
+        self._stopping: asyncio.Event | None = None
+
+    async def start(self) -> None:
+        if not self.enabled or self._task is not None:
+            return
+        self._stopping = asyncio.Event()
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._stopping.set()
+        await self._task
+        self._task = None
+
+    async def _run(self) -> None:
+        while not self._stopping.is_set():
+            try:
+                await self.sweep()
+            except Exception:
+                logger.exception("Event lifecycle sweep failed")
+            try:
+                await asyncio.wait_for(self._stopping.wait(), self.interval)
+            except asyncio.TimeoutError:
+                pass
+
+    def _transition(self, from_statuses: tuple[str, ...], to_status: str, starts_before: datetime, now: datetime, starts_after: datetime | None = None):
+        # Oldest first, in batches; rows locked by a concurrent edit are picked up next sweep.
+        # The (status, datetime) index serves the inner select.
+        conditions = [Event.status.in_(from_statuses), Event.datetime <= starts_before]
+        if starts_after is not None:
+            conditions.append(Event.datetime > starts_after)
+        due = (
+            select(Event.id)
+            .where(*conditions)
+            .order_by(Event.datetime)
+            .limit(self.batch_size)
+            .with_for_update(skip_locked=True)
+        )
+        return (
+            update(Event)
+            .where(Event.id.in_(due.scalar_subquery()))
+            .values(status=to_status, updated_at=now)
+            .returning(Event.id, Event.datetime)
+        )
+
+    async def sweep(self) -> tuple[int, int]:
+        """One pass. Returns (events started, events closed); (0, 0) if another worker holds the lock."""
+        async with AsyncSessionLocal() as db:
+            if not await db.scalar(select(func.pg_try_advisory_xact_lock(LIFECYCLE_LOCK_ID))):
+                self.skipped += 1
+                return 0, 0
+            now = datetime.utcnow()
+            closed = []
+            if self.close_after is not None:
+                # Close first so an event that is already past its window goes straight to Closed
+                closed = (await db.execute(self._transition(("Scheduled", "Live"), "Closed", now - self.close_after, now))).all()
+            started = (await db.execute(self._transition(("Scheduled",), "Live", now, now, starts_after=now - self.start_window))).all()
+            await db.commit()
+
+            for event_id, when in [*closed, *started]:
+                event_cache.invalidate(event_id)
+                calendar_cache.invalidate_month(when)
+            if closed:
+                # Feedback this worker queued before the close belongs in the snapshots
+                await feedback_ingestor.flush()
+            for event_id, _ in closed:
+                await self._snapshot(db, event_id)
+
+        self.sweeps += 1
+        self.started += len(started)
+        self.closed += len(closed)
+        self.last_sweep = now
+        return len(started), len(closed)
+
+    async def _snapshot(self, db, event_id: UUID) -> None:
+        try:
+            await summary.write_snapshot(db, event_id)
+        except Exception:
+            # The summary page writes a missing snapshot on first visit
+            await db.rollback()
+            logger.exception("Could not snapshot the summary of event %s", event_id)
+
+    def stats(self) -> dict:
+        return {
+            "enabled": self.enabled,
+            "running": self._task is not None,
+            "sweeps": self.sweeps,
+            "skipped": self.skipped,
+            "started": self.started,
+            "closed": self.closed,
+            "auto_start_window_hours": self.start_window / timedelta(hours=1),
+            "auto_close_after_hours": self.close_after / timedelta(hours=1) if self.close_after is not None else None,
+            "last_sweep": self.last_sweep.isoformat() if self.last_sweep else None,
+        }
+
+
+lifecycle_scheduler = LifecycleScheduler(
+    enabled=settings.LIFECYCLE_ENABLED,
+    interval_seconds=settings.LIFECYCLE_INTERVAL_SECONDS,
+    batch_size=settings.LIFECYCLE_BATCH_SIZE,
+    start_window=timedelta(hours=settings.EVENT_AUTO_START_WINDOW_HOURS),
+    close_after=(
+        timedelta(hours=settings.EVENT_AUTO_CLOSE_AFTER_HOURS) if settings.EVENT_AUTO_CLOSE_AFTER_HOURS is not None else None
+    ),
+)
@@ -0,0 +1,261 @@
+# app/live/notify.py
+import asyncio
+import json
+import logging
+import uuid
+from collections import OrderedDict
+from dataclasses import asdict
+from datetime import datetime
+from uuid import UUID
+
+from sqlalchemy import Text, cast, column, func, select
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession
+
+from app.analytics.keywords import keyword_index
+from app.core.config import settings
+from app.core.invalidation import invalidation_bus
+from app.db.session import AsyncSessionLocal, engine
+from app.live.broadcast import FeedbackMessage, feedback_broadcaster
+from app.live.watermarks import feedback_watermarks
+from app.models.feedback import Feedback
+
+logger = logging.getLogger(__name__)
+
+# NOTIFY payloads must stay under 8000 bytes; bigger messages go out as a reference to the row
+MAX_PAYLOAD_BYTES = 7900
+
+# Every worker listens here for the other workers' cache invalidations (app/core/invalidation.py)
+INVALIDATION_CHANNEL = "cache_invalidation"
+
+
+def channel_for(event_id: UUID) -> str:
+    return f"feedback_{event_id.hex}"
+
+
+def apply_message(message: FeedbackMessage) -> None:
+    """Record a committed feedback change in this worker: watermark, live subscribers, keywords."""
+    feedback_watermarks.touch(message.event_id, message.id, created=message.kind == "created")
+    feedback_broadcaster.publish(message)
+    if message.kind == "created":
+        keyword_index.observe(message.event_id, message.comment)
+
+
+class FeedbackNotifier:
+    """Cross-worker fan-out of feedback changes over Postgres LISTEN/NOTIFY.
+
+    Writers NOTIFY the event's channel inside their transaction, so other workers hear about
+    a change exactly when it commits. Each worker keeps one pooled connection LISTENing on the
+    channels of events it serves live (SSE subscribers or feedback watermarks) and applies what
+    it hears locally. A worker's own notifications are skipped; it applied them after commit.
+
+    The same connection carries cache invalidations, so an event, calendar or user cached in
+    another worker is dropped as soon as it changes rather than when its TTL runs out.
+    """
+
+    def __init__(self, enabled: bool, max_channels: int, reconnect_seconds: float = 1.0):
+        self.enabled = enabled
+        self.max_channels = max_channels
+        self.reconnect_seconds = reconnect_seconds
+        self.origin = uuid.uuid4().hex
+        self.sent = 0
+        self.received = 0
+        self.reconnects = 0
+        self._conn: AsyncConnection | None = None
+        self._raw = None
+        self._watched: OrderedDict[UUID, None] = OrderedDict()
+        self._lock = asyncio.Lock()
+        self._reconnect_task: asyncio.Task | None = None
+        self._closing = False
+        self._invalidations: list[str] = []
+        self._invalidation_task: asyncio.Task | None = None
+
+    async def start(self) -> None:
+        if not self.enabled:
+            return
+        self._closing = False
+        async with self._lock:
+            await self._connect()
+        invalidation_bus.attach(self._send_invalidation)
+
+    async def stop(self) -> None:
+        self._closing = True
+        invalidation_bus.attach(None)
+        if self._invalidation_task is not None:
+            await self._invalidation_task
+        if self._reconnect_task is not None:
+            self._reconnect_task.cancel()
+            self._reconnect_task = None
+        async with self._lock:
+            await self._disconnect()
+
+    async def _connect(self) -> None:
+        self._conn = await engine.connect()
+        try:
+            self._raw = (await self._conn.get_raw_connection()).driver_connection
+            self._raw.add_termination_listener(self._on_lost)
+            await self._raw.add_listener(INVALIDATION_CHANNEL, self._on_notify)
+            for event_id in self._watched:
+                await self._raw.add_listener(channel_for(event_id), self._on_notify)
+        except Exception:
+            await self._disconnect()
+            raise
+        # Anything recorded while we were not listening may have missed remote changes
+        for event_id in self._watched:
+            feedback_watermarks.discard(event_id)
+        invalidation_bus.reset_all()
+
+    async def _disconnect(self) -> None:
+        if self._conn is None:
+            return
+        conn, self._conn, self._raw = self._conn, None, None
+        # Listening connections don't go back to the pool
+        await conn.invalidate()
+        await conn.close()
+
+    def _on_lost(self, _connection) -> None:
+        self._conn = self._raw = None
+        if self._closing:
+            return
+        for event_id in self._watched:
+            feedback_watermarks.discard(event_id)
+        invalidation_bus.reset_all()
+        if self._reconnect_task is None:
+            self._reconnect_task = asyncio.get_running_loop().create_task(self._reconnect())
+
+    async def _reconnect(self) -> None:
+        try:
+            while not self._closing:
+                await asyncio.sleep(self.reconnect_seconds)
+                try:
+                    async with self._lock:
+                        await self._connect()
+                    self.reconnects += 1
+                    return
+                except Exception:
+                    logger.exception("Feedback LISTEN connection lost; retrying")
+        finally:
+            self._reconnect_task = None
+
+    async def watch(self, event_id: UUID) -> None:
+        """LISTEN for the event's changes from other workers. Call before taking a watermark baseline."""
+        if not self.enabled:
+            return
+        if event_id in self._watched:
+            self._watched.move_to_end(event_id)
+            return
+        async with self._lock:
+            if event_id in self._watched:
+                return
+            if self._raw is not None:
+                await self._raw.add_listener(channel_for(event_id), self._on_notify)
+            self._watched[event_id] = None
+            await self._evict()
+
+    async def _evict(self) -> None:
+        # Oldest events without local subscribers first; their watermarks go too, since
+        # nothing would keep them current
+        for event_id in list(self._watched):
+            if len(self._watched) <= self.max_channels:
+                return
+            if feedback_broadcaster.subscriber_count(event_id):
+                continue
+            await self._unlisten(event_id)
+
+    async def _unlisten(self, event_id: UUID) -> None:
+        self._watched.pop(event_id, None)
+        feedback_watermarks.discard(event_id)
+        if self._raw is not None:
+            await self._raw.remove_listener(channel_for(event_id), self._on_notify)
+
+    async def unwatch(self, event_id: UUID) -> None:
+        if event_id in self._watched:
+            async with self._lock:
+                await self._unlisten(event_id)
+
+    def _payload(self, message: FeedbackMessage) -> str:
+        data = asdict(message)
+        data.update(origin=self.origin, id=message.id.hex, event_id=message.event_id.hex, timestamp=message.timestamp.isoformat())
+        payload = json.dumps(data, ensure_ascii=False)
+        if len(payload.encode()) > MAX_PAYLOAD_BYTES:
+            payload = json.dumps({"origin": self.origin, "kind": message.kind, "id": data["id"], "event_id": data["event_id"], "ref": True})
+        return payload
+
+    async def notify(self, db: AsyncSession, messages: list[FeedbackMessage]) -> None:
+        """Queue NOTIFYs on the caller's transaction; they are delivered when it commits."""
+        if not self.enabled or not messages:
+            return
+        channels = [channel_for(message.event_id) for message in messages]
+        payloads = [self._payload(message) for message in messages]
+        notes = func.unnest(cast(channels, ARRAY(Text)), cast(payloads, ARRAY(Text))).table_valued(column("channel"), column("payload"))
+        await db.execute(select(func.pg_notify(notes.c.channel, notes.c.payload)).select_from(notes))
+        self.sent += len(messages)
+
+    def _send_invalidation(self, name: str, args: list) -> None:
+        # Called after the change committed, from sync code. Invalidations are queued and sent by
+        # one task on one pooled connection, so a sweep that touches hundreds of events costs a
+        # single checkout rather than one each.
+        self._invalidations.append(json.dumps({"origin": self.origin, "cache": name, "args": args}))
+        if self._invalidation_task is None:
+            self._invalidation_task = asyncio.get_running_loop().create_task(self._flush_invalidations())
+
+    async def _flush_invalidations(self) -> None:
+        try:
+            while self._invalidations:
+                # Identical payloads within a transaction are delivered once anyway
+                payloads, self._invalidations = list(dict.fromkeys(self._invalidations)), []
+                payload = func.unnest(cast(payloads, ARRAY(Text))).column_valued("payload")
+                try:
+                    async with engine.connect() as conn:
+                        await conn.execute(select(func.pg_notify(INVALIDATION_CHANNEL, payload)))
+                        await conn.commit()
+                    self.sent += len(payloads)
+                except Exception:
+                    # Other workers keep their copies until the cache TTL expires
+                    logger.exception("Could not broadcast %d cache invalidations", len(payloads))
+        finally:
+            self._invalidation_task = None
+
+    def _on_notify(self, _connection, _pid, channel, payload: str) -> None:
+        data = json.loads(payload)
+        if data["origin"] == self.origin:
+            return
+        self.received += 1
+        if channel == INVALIDATION_CHANNEL:
+            invalidation_bus.apply(data["cache"], data["args"])
+            return
+        if data.get("ref"):
+            asyncio.get_running_loop().create_task(self._apply_ref(data["kind"], UUID(hex=data["id"])))
+            return
+        apply_message(FeedbackMessage(
+            kind=data["kind"],
+            id=UUID(hex=data["id"]),
+            event_id=UUID(hex=data["event_id"]),
+            emoji=data["emoji"],
+            comment=data["comment"],
+            timestamp=datetime.fromisoformat(data["timestamp"]),
+            pinned=data["pinned"],
+            flagged=data["flagged"],
+        ))
+
+    async def _apply_ref(self, kind: str, feedback_id: UUID) -> None:
+        async with AsyncSessionLocal() as db:
+            feedback = await db.get(Feedback, feedback_id)
+        if feedback is not None:
+            apply_message(FeedbackMessage.from_feedback(kind, feedback))
+
+    def stats(self) -> dict:
+        return {
+            "enabled": self.enabled,
+            "connected": self._raw is not None,
+            "channels": len(self._watched),
+            "sent": self.sent,
+            "received": self.received,
+            "reconnects": self.reconnects,
+        }
+
+
+feedback_notifier = FeedbackNotifier(
+    enabled=settings.FEEDBACK_NOTIFY_ENABLED,
+    max_channels=settings.FEEDBACK_NOTIFY_MAX_CHANNELS,
+)
@@ -0,0 +1,100 @@
+# app/live/watermarks.py
+import time
+import uuid
+from collections import OrderedDict, deque
+from dataclasses import dataclass, field
+from uuid import UUID
+
+
+@dataclass(frozen=True)
+class FeedbackCursor:
+    # Watermark version the client has caught up to. Versions follow the order changes were
+    # applied after commit in the worker that issued the cursor (`origin`), unlike feedback
+    # timestamps, which are taken before the INSERT commits. Another worker applies changes in
+    # its own order, so its versions can't be compared with this one.
+    origin: str
+    version: int
+
+    def encode(self) -> str:
+        return f"{self.origin}.{self.version}"
+
+    @classmethod
+    def decode(cls, value: str) -> "FeedbackCursor | None":
+        origin, _, version = value.partition(".")
+        try:
+            return cls(origin, int(version))
+        except ValueError:
+            return None
+
+
+@dataclass
+class EventWatermark:
+    # `version` moves on every change; every change newer than `floor` is in `changes` as
+    # (version, feedback id, created).
+    version: int
+    floor: int
+    changes: deque = field(default_factory=deque)
+
+    def changed_since(self, version: int) -> dict[UUID, bool]:
+        """Feedback ids changed after `version`, mapped to whether they were created (not just moderated) since."""
+        changed: dict[UUID, bool] = {}
+        for v, feedback_id, created in self.changes:
+            if v > version:
+                changed[feedback_id] = changed.get(feedback_id, False) or created
+        return changed
+
+
+class FeedbackWatermarks:
+    """Per-event "last modified" marks so unchanged feedback streams can be answered without a query."""
+
+    def __init__(self, max_events: int = 10_000, max_changes: int = 1024):
+        self.origin = uuid.uuid4().hex
+        self.max_events = max_events
+        self.max_changes = max_changes
+        self._marks: OrderedDict[UUID, EventWatermark] = OrderedDict()
+
+    def _next_version(self, current: int = 0) -> int:
+        # Wall-clock based so cursors stay comparable across worker restarts.
+        return max(time.time_ns(), current + 1)
+
+    def get(self, event_id: UUID) -> EventWatermark | None:
+        mark = self._marks.get(event_id)
+        if mark is not None:
+            self._marks.move_to_end(event_id)
+        return mark
+
+    def baseline(self, event_id: UUID) -> EventWatermark:
+        mark = self.get(event_id)
+        if mark is None:
+            now = self._next_version()
+            mark = EventWatermark(version=now, floor=now)
+            self._marks[event_id] = mark
+            while len(self._marks) > self.max_events:
+                self._marks.popitem(last=False)
+        return mark
+
+    def cursor(self, version: int) -> FeedbackCursor:
+        return FeedbackCursor(self.origin, version)
+
+    def own(self, cursor: FeedbackCursor | None) -> FeedbackCursor | None:
+        """The cursor if this worker issued it; None (start over) for another worker's or a restarted one's."""
+        return cursor if cursor is not None and cursor.origin == self.origin else None
+
+    def touch(self, event_id: UUID, changed_id: UUID, created: bool) -> int:
+        # Only events someone polls have a mark; the stream takes the baseline (after the
+        # notifier starts listening), so a mark never predates changes it would have missed
+        mark = self.get(event_id)
+        if mark is None:
+            return self._next_version()
+        mark.version = self._next_version(mark.version)
+        mark.changes.append((mark.version, changed_id, created))
+        while len(mark.changes) > self.max_changes:
+            dropped_version, _, _ = mark.changes.popleft()
+            mark.floor = dropped_version
+        return mark.version
+
+    def discard(self, event_id: UUID) -> None:
+        self._marks.pop(event_id, None)
+
+
+feedback_watermarks = FeedbackWatermarks()
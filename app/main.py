@@ -1,32 +1,109 @@
-from fastapi import FastAPI
+import logging
+import secrets
+import time
+
+from fastapi import FastAPI, HTTPException, Request
+from fastapi.responses import JSONResponse, PlainTextResponse
 from fastapi.staticfiles import StaticFiles
-from fastapi.templating import Jinja2Templates
-from contextlib import asynccontextmanager
+from contextlib import asynccontextmanager, contextmanager
 
 from app.models.user import User
 from app.schemas.user import UserRead, UserCreate, UserUpdate
 from app.users import fastapi_users, auth_backend
 from app.api import events
 from app.api import ui
-from app.db.session import engine
-from app.db.base import Base 
+from app.api import internal
+from app.core.config import settings
+from app.core.metrics import MetricsMiddleware, metrics
+from app.core.templates import precompile_templates
+from app.db.pool import prewarm_pool
+from app.db.routing import ReadYourWritesMiddleware
+from app.db.session import engine, replica_engine
+from app.db.schema import check_schema_version
 from app.models.registry import register_models
+from app.analytics.keywords import keyword_index
+from app.live.ingest import feedback_ingestor
+from app.live.lifecycle import lifecycle_scheduler
+from app.live.notify import feedback_notifier
+
+logger = logging.getLogger(__name__)
+
+
+def _configure_logging() -> None:
+    # uvicorn's default config only sets up its own loggers, which would leave ours at WARNING
+    # with no handler. A root handler means the deployment configured logging itself.
+    app_logger = logging.getLogger("app")
+    app_logger.setLevel(settings.LOG_LEVEL.upper())
+    if not logging.getLogger().handlers and not app_logger.handlers:
+        handler = logging.StreamHandler()
+        handler.setFormatter(logging.Formatter("%(levelname)s:     [%(process)d] %(name)s: %(message)s"))
+        app_logger.addHandler(handler)
+    # SQLAlchemy names pool loggers after the pool class, so our pool subclasses land under
+    # `app`; keep their per-connection chatter at SQLAlchemy's default
+    logging.getLogger("app.db.pool").setLevel(logging.WARNING)
+
+
+_configure_logging()
+
+
+@contextmanager
+def _timed(timings: dict[str, float], phase: str):
+    start = time.perf_counter()
+    yield
+    timings[phase] = round((time.perf_counter() - start) * 1000, 1)
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
+    # /ready answers 503 until every phase below has finished
+    app.state.ready = False
+    timings = app.state.startup_ms = {}
+    start = time.perf_counter()
     register_models()
-    
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
-        print("Tables created:", list(Base.metadata.tables.keys()))
+
+    if settings.STARTUP_SCHEMA_CHECK:
+        with _timed(timings, "schema_check"):
+            revision = await check_schema_version(engine)
+        logger.info("Database schema at revision %s", revision)
+    if settings.DB_POOL_PREWARM:
+        with _timed(timings, "pool_prewarm"):
+            opened = await prewarm_pool(engine, settings.DB_POOL_PREWARM)
+            if replica_engine is not None:
+                await prewarm_pool(replica_engine, settings.DB_POOL_PREWARM)
+        logger.info("Pool connections opened: %d", opened)
+    if settings.TEMPLATE_PRECOMPILE:
+        with _timed(timings, "templates"):
+            compiled = precompile_templates()
+        logger.info("Templates compiled: %d", compiled)
+    with _timed(timings, "background_tasks"):
+        await feedback_notifier.start()
+        await feedback_ingestor.start()
+        await lifecycle_scheduler.start()
+
+    timings["total"] = round((time.perf_counter() - start) * 1000, 1)
+    logger.info("Worker ready: %s", ", ".join(f"{phase} {ms} ms" for phase, ms in timings.items()))
+    app.state.ready = True
     yield
 
+    # Fail readiness first so load balancers stop sending new requests while this worker drains
+    app.state.ready = False
+    # Queued feedback has already been acknowledged to clients; flush it before the pool goes away
+    await feedback_ingestor.stop()
+    await lifecycle_scheduler.stop()
+    await feedback_notifier.stop()
+    keyword_index.shutdown()
     await engine.dispose()
+    if replica_engine is not None:
+        await replica_engine.dispose()
 
 app = FastAPI(lifespan=lifespan)
-
-templates = Jinja2Templates(directory="app/templates")
+app.add_middleware(ReadYourWritesMiddleware, window_seconds=settings.READ_YOUR_WRITES_SECONDS)
+if settings.METRICS_ENABLED:
+    # Added last so it wraps the other middleware and times the whole request
+    app.add_middleware(MetricsMiddleware, metrics=metrics)
+    metrics.instrument_engine(engine, "primary")
+    if replica_engine is not None:
+        metrics.instrument_engine(replica_engine, "replica")
 
 
 app.include_router(
@@ -55,3 +132,23 @@ def root():
 app.include_router(events.router, prefix="/events", tags=["events"])
 
 app.include_router(ui.router)
+
+app.include_router(internal.router, prefix="/internal", tags=["internal"])
+
+
+@app.get("/metrics", include_in_schema=False)
+def prometheus_metrics(request: Request):
+    if not settings.METRICS_ENABLED:
+        raise HTTPException(status_code=404)
+    if settings.METRICS_TOKEN and not secrets.compare_digest(
+        request.headers.get("authorization", ""), f"Bearer {settings.METRICS_TOKEN}"
+    ):
+        raise HTTPException(status_code=401)
+    return PlainTextResponse(metrics.render(), media_type="text/plain; version=0.0.4")
+
+
+@app.get("/ready", include_in_schema=False)
+def readiness(request: Request):
+    ready = getattr(request.app.state, "ready", False)
+    body = {"ready": ready, "startup_ms": getattr(request.app.state, "startup_ms", {})}
+    return JSONResponse(body, status_code=200 if ready else 503)
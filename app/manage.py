@@ -0,0 +1,57 @@
+# app/manage.py -- operational commands, e.g. `python -m app.manage rebuild-rollups`
+import argparse
+import asyncio
+from uuid import UUID
+
+from app.db.session import AsyncSessionLocal, engine
+from app.models.registry import register_models
+from app.analytics import rollups, summary
+
+
+async def rebuild_rollups(event_id: UUID | None) -> None:
+    async with AsyncSessionLocal() as db:
+        if event_id:
+            await rollups.rebuild(db, event_id)
+            print(f"Rebuilt rollups for event {event_id}")
+        else:
+            count = await rollups.rebuild_all(db)
+            print(f"Rebuilt rollups for {count} events")
+
+
+async def regenerate_summaries(event_id: UUID | None) -> None:
+    async with AsyncSessionLocal() as db:
+        if event_id:
+            await summary.write_snapshot(db, event_id)
+            print(f"Regenerated summary for event {event_id}")
+        else:
+            count = await summary.regenerate_closed(db)
+            print(f"Regenerated summaries for {count} closed events")
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(prog="python -m app.manage")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    rebuild = commands.add_parser("rebuild-rollups", help="Recompute per-event analytics rollups from raw RSVP/feedback rows")
+    rebuild.add_argument("--event-id", type=UUID, help="Only rebuild this event (default: all events)")
+
+    regenerate = commands.add_parser("regenerate-summaries", help="Recompute stored summary snapshots of closed events")
+    regenerate.add_argument("--event-id", type=UUID, help="Only regenerate this event (default: all closed events)")
+
+    args = parser.parse_args(argv)
+    register_models()
+
+    async def run():
+        try:
+            if args.command == "rebuild-rollups":
+                await rebuild_rollups(args.event_id)
+            elif args.command == "regenerate-summaries":
+                await regenerate_summaries(args.event_id)
+        finally:
+            await engine.dispose()
+
+    asyncio.run(run())
+
+
+if __name__ == "__main__":
+    main()
@@ -1,12 +1,24 @@
-from sqlalchemy import Column, String, DateTime, Integer, ForeignKey
+from sqlalchemy import Column, String, DateTime, Integer, ForeignKey, Index
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from app.models.user import Base
 import uuid
 from datetime import datetime
 
+def _utcnow() -> datetime:
+    # `datetime` is shadowed by the column of that name inside the class body
+    return datetime.utcnow()
+
+
 class Event(Base):
     __tablename__ = "events"
+    __table_args__ = (
+        # Keyset pagination of a host's events on (datetime, id), optionally by status
+        Index("ix_events_host_id_datetime_id", "host_id", "datetime", "id"),
+        Index("ix_events_host_id_status_datetime_id", "host_id", "status", "datetime", "id"),
+        # Lifecycle sweeps: events in a given status that are due by a given time
+        Index("ix_events_status_datetime", "status", "datetime"),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     title: Mapped[str] = mapped_column(String, nullable=False)
@@ -17,3 +29,4 @@ class Event(Base):
     max_attendees: Mapped[int] = mapped_column(Integer)
     status: Mapped[str] = mapped_column(String, default="Scheduled")
     host_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("user.id"))
+    updated_at: Mapped[datetime] = mapped_column(DateTime, nullable=False, default=_utcnow, onupdate=_utcnow)
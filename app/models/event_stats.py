@@ -0,0 +1,35 @@
+from sqlalchemy import String, DateTime, Integer, ForeignKey
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import Mapped, mapped_column
+from app.models.user import Base
+import uuid
+from datetime import datetime
+
+# Per-event rollups, kept in step with rsvps/feedback by app/analytics/rollups.py.
+# `python -m app.manage rebuild-rollups` recomputes them from the raw tables.
+
+class EventStats(Base):
+    __tablename__ = "event_stats"
+
+    event_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("events.id", ondelete="CASCADE"), primary_key=True)
+    rsvp_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0, server_default="0")
+    checkin_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0, server_default="0")
+    feedback_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0, server_default="0")
+    # Bumped on every pin/flag toggle; with feedback_count it versions the feedback stream for ETags
+    moderation_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0, server_default="0")
+
+
+class EventEmojiCount(Base):
+    __tablename__ = "event_emoji_counts"
+
+    event_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("events.id", ondelete="CASCADE"), primary_key=True)
+    emoji: Mapped[str] = mapped_column(String, primary_key=True)
+    count: Mapped[int] = mapped_column(Integer, nullable=False, default=0, server_default="0")
+
+
+class EventFeedbackMinute(Base):
+    __tablename__ = "event_feedback_minutes"
+
+    event_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("events.id", ondelete="CASCADE"), primary_key=True)
+    minute: Mapped[datetime] = mapped_column(DateTime, primary_key=True)
+    count: Mapped[int] = mapped_column(Integer, nullable=False, default=0, server_default="0")
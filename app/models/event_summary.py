@@ -0,0 +1,16 @@
+from sqlalchemy import DateTime, ForeignKey
+from sqlalchemy.dialects.postgresql import JSONB, UUID
+from sqlalchemy.orm import Mapped, mapped_column
+from app.models.user import Base
+import uuid
+from datetime import datetime
+
+# Frozen summary of a closed event, written by app/analytics/summary.py when the event closes.
+# `python -m app.manage regenerate-summaries` rewrites them.
+
+class EventSummarySnapshot(Base):
+    __tablename__ = "event_summaries"
+
+    event_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("events.id", ondelete="CASCADE"), primary_key=True)
+    generated_at: Mapped[datetime] = mapped_column(DateTime, nullable=False, default=datetime.utcnow)
+    data: Mapped[dict] = mapped_column(JSONB, nullable=False)
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, DateTime, ForeignKey, Boolean
+from sqlalchemy import Column, String, DateTime, ForeignKey, Boolean, Index
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column
 from app.models.user import Base
@@ -7,6 +7,11 @@ from datetime import datetime
 
 class Feedback(Base):
     __tablename__ = "feedback"
+    __table_args__ = (
+        # Serves the live stream's newest-first snapshot. Deltas find rows by id from the
+        # change log (app/live/watermarks.py), not by a timestamp cursor.
+        Index("ix_feedback_event_id_timestamp", "event_id", "timestamp", "id"),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     event_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("events.id", ondelete="CASCADE"))
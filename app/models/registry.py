@@ -4,8 +4,10 @@ from app.models.user import User
 from app.models.event import Event
 from app.models.rsvp import RSVP
 from app.models.feedback import Feedback
+from app.models.event_stats import EventStats, EventEmojiCount, EventFeedbackMinute
+from app.models.event_summary import EventSummarySnapshot
 
-__all__ = ["User", "Event", "RSVP", "Feedback"]
+__all__ = ["User", "Event", "RSVP", "Feedback", "EventStats", "EventEmojiCount", "EventFeedbackMinute", "EventSummarySnapshot"]
 
 # This ensures all models are registered with SQLAlchemy
 def register_models():
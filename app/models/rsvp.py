@@ -1,4 +1,4 @@
-from sqlalchemy import DateTime, ForeignKey
+from sqlalchemy import DateTime, ForeignKey, Index, UniqueConstraint
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column
 from app.models.user import Base
@@ -7,6 +7,10 @@ from datetime import datetime
 
 class RSVP(Base):
     __tablename__ = "rsvps"
+    __table_args__ = (
+        UniqueConstraint("event_id", "user_id", name="uq_rsvps_event_id_user_id"),
+        Index("ix_rsvps_user_id", "user_id"),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     event_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("events.id", ondelete="CASCADE"))
@@ -7,6 +7,7 @@ from fastapi_users.authentication import AuthenticationBackend, CookieTransport,
 
 from app.models.user import User
 from app.users.db import get_user_db
+from app.users.cache import CachedJWTStrategy, invalidate_user
 from app.core.config import settings
 
 SECRET = settings.SECRET
@@ -18,6 +19,13 @@ class UserManager(UUIDIDMixin, BaseUserManager[User, UUID]):
     async def on_after_register(self, user: User, request: Optional[Request] = None):
         print(f"User {user.id} has registered.")
 
+    async def on_after_update(self, user: User, update_dict: dict, request: Optional[Request] = None):
+        # Covers deactivation too (is_active is just another updated field)
+        invalidate_user(str(user.id))
+
+    async def on_after_delete(self, user: User, request: Optional[Request] = None):
+        invalidate_user(str(user.id))
+
 async def get_user_manager(user_db=Depends(get_user_db)):
     yield UserManager(user_db)
 
@@ -25,7 +33,7 @@ async def get_user_manager(user_db=Depends(get_user_db)):
 cookie_transport = CookieTransport(cookie_name="eventpulse", cookie_max_age=3600)
 
 def get_jwt_strategy() -> JWTStrategy:
-    return JWTStrategy(secret=SECRET, lifetime_seconds=3600)
+    return CachedJWTStrategy(secret=SECRET, lifetime_seconds=3600)
 
 auth_backend = AuthenticationBackend(
     name="jwt",
@@ -37,4 +45,5 @@ fastapi_users = FastAPIUsers[User, UUID](
     get_user_manager,
     [auth_backend],
 )
-current_active_user = fastapi_users.current_user(active=True)
\ No newline at end of file
+current_active_user = fastapi_users.current_user(active=True)
+current_superuser = fastapi_users.current_user(active=True, superuser=True)
\ No newline at end of file
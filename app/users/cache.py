@@ -0,0 +1,60 @@
+import jwt
+from fastapi_users import exceptions
+from fastapi_users.authentication import JWTStrategy
+from fastapi_users.jwt import decode_jwt
+from sqlalchemy import inspect
+from sqlalchemy.orm import make_transient_to_detached
+
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.core.invalidation import invalidation_bus
+from app.models.user import User
+
+# Resolved users keyed by the token subject (the user id as a string). The JWT is still
+# decoded and its expiry checked on every request; only the User row lookup is cached.
+# Entries hold the row's column values, never a User instance: each request gets its own
+# detached copy, which a profile update can attach to its session and modify freely.
+user_cache = TTLCache(settings.USER_CACHE_SIZE, settings.USER_CACHE_TTL_SECONDS)
+invalidation_bus.register("user", user_cache.invalidate, user_cache.clear)
+
+
+def _row(user: User) -> dict:
+    return {attr.key: getattr(user, attr.key) for attr in inspect(User).column_attrs}
+
+
+def _detached(row: dict) -> User:
+    user = User(**row)
+    # Persistent identity without a session, so adding it to one updates rather than inserts
+    make_transient_to_detached(user)
+    return user
+
+
+def invalidate_user(user_id: str) -> None:
+    """Drop a user after an update (including deactivation) or delete, in every worker."""
+    user_cache.invalidate(user_id)
+    invalidation_bus.publish("user", user_id)
+
+
+class CachedJWTStrategy(JWTStrategy):
+    async def read_token(self, token, user_manager):
+        if token is None:
+            return None
+
+        try:
+            data = decode_jwt(token, self.decode_key, self.token_audience, algorithms=[self.algorithm])
+        except jwt.PyJWTError:
+            return None
+        user_id = data.get("sub")
+        if user_id is None:
+            return None
+
+        row = user_cache.get(user_id)
+        if row is not None:
+            return _detached(row)
+
+        try:
+            user = await user_manager.get(user_manager.parse_id(user_id))
+        except (exceptions.UserNotExists, exceptions.InvalidID):
+            return None
+        user_cache.set(user_id, _row(user))
+        return user
@@ -0,0 +1 @@
+# bench -- seeded load tests for the EventPulse hot paths, e.g. `python -m bench seed` then `python -m bench run [--scenario NAME ...]`
@@ -0,0 +1,103 @@
+# bench/__main__.py
+import argparse
+import asyncio
+import json
+import subprocess
+from dataclasses import asdict, fields
+from datetime import datetime
+from pathlib import Path
+
+from app.core.config import settings
+from app.core.ratelimit import rate_limit
+from app.db.session import engine
+from app.live.lifecycle import lifecycle_scheduler
+from app.main import app
+from app.models.registry import register_models
+from bench.dataset import DEFAULT_MANIFEST, Dataset
+from bench.scenarios import SCENARIOS, Options
+from bench.seed import reset, seed
+
+
+def _git_commit() -> str | None:
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+async def run_scenarios(dataset: Dataset, names: list[str], options: Options, keep_limits: bool) -> dict:
+    # The load comes from a handful of users far faster than any person could click
+    rate_limit.enabled = keep_limits and rate_limit.enabled
+    # Status sweeps would add unrelated writes to every scenario
+    lifecycle_scheduler.enabled = False
+
+    results = []
+    async with app.router.lifespan_context(app):
+        for name in names:
+            print(f"Running {name}...")
+            results.append(await SCENARIOS[name](dataset, options))
+    return {
+        "commit": _git_commit(),
+        "started_at": datetime.utcnow().isoformat(),
+        "settings": {
+            "db_profile": settings.DB_PROFILE,
+            "feedback_ingest_mode": settings.FEEDBACK_INGEST_MODE,
+            "rate_limits": rate_limit.enabled,
+        },
+        "dataset": asdict(dataset),
+        "options": asdict(options),
+        "results": results,
+    }
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(prog="python -m bench")
+    parser.add_argument("--manifest", type=Path, default=DEFAULT_MANIFEST, help="Where seed records the dataset sizes")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    seed_cmd = commands.add_parser("seed", help="Replace the bench data with a fresh synthetic dataset (bulk COPY)")
+    for field in fields(Dataset):
+        if field.name != "month":
+            seed_cmd.add_argument(f"--{field.name.replace('_', '-')}", type=int, default=field.default)
+
+    commands.add_parser("reset", help="Delete all bench users and events")
+
+    run_cmd = commands.add_parser("run", help="Run scenarios in-process and print JSON results")
+    run_cmd.add_argument("--scenario", dest="scenarios", action="append", choices=list(SCENARIOS), help="Repeatable (default: all)")
+    run_cmd.add_argument("--clients", type=int, help="Concurrent clients (default per scenario)")
+    run_cmd.add_argument("--requests", type=int, help="Requests per client, or total for summary_large")
+    run_cmd.add_argument("--duration", type=float, default=Options.duration, help="Seconds for duration-based scenarios")
+    run_cmd.add_argument("--ramp", type=float, default=Options.ramp, help="Seconds over which clients start")
+    run_cmd.add_argument("--poll-interval", type=float, default=Options.poll_interval)
+    run_cmd.add_argument("--keep-rate-limits", action="store_true", help="Leave per-user rate limits on")
+    run_cmd.add_argument("--output", type=Path, help="Also write the JSON results here")
+
+    args = parser.parse_args(argv)
+    register_models()
+
+    async def run():
+        try:
+            if args.command == "seed":
+                dataset = Dataset(**{f.name: getattr(args, f.name) for f in fields(Dataset) if f.name != "month"})
+                await seed(dataset)
+                dataset.save(args.manifest)
+                print(f"Dataset written to {args.manifest}")
+            elif args.command == "reset":
+                await reset()
+            elif args.command == "run":
+                options = Options(args.clients, args.duration, args.requests, args.ramp, args.poll_interval)
+                names = args.scenarios or list(SCENARIOS)
+                return await run_scenarios(Dataset.load(args.manifest), names, options, args.keep_rate_limits)
+        finally:
+            await engine.dispose()
+
+    results = asyncio.run(run())
+    if results is not None:
+        output = json.dumps(results, indent=2, ensure_ascii=False)
+        print(output)
+        if args.output:
+            args.output.write_text(output + "\n")
+
+
+if __name__ == "__main__":
+    main()
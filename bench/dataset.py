@@ -0,0 +1,73 @@
+# bench/dataset.py
+import json
+import uuid
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from pathlib import Path
+from uuid import UUID
+
+# Every bench id is derived from this namespace, so seeding and scenarios agree without lookups
+BENCH_NAMESPACE = UUID("3c5b7a52-9d0e-4f38-8d53-1f6f0b0e2a11")
+BENCH_EMAIL_DOMAIN = "bench.eventpulse.invalid"
+DEFAULT_MANIFEST = Path(".bench-dataset.json")
+
+
+def bench_id(kind: str, n: int | str) -> UUID:
+    return uuid.uuid5(BENCH_NAMESPACE, f"{kind}-{n}")
+
+
+@dataclass
+class Dataset:
+    """Sizes of a seeded dataset. Saved next to the database so `run` uses what `seed` wrote."""
+
+    users: int = 5_000
+    events: int = 2_000
+    heavy_users: int = 50
+    rsvps_per_heavy_user: int = 200
+    feedback_rows: int = 1_000_000
+    live_feedback: int = 10_000
+    summary_comments: int = 100_000
+    rush_capacity: int = 500
+    seed: int = 42
+    # Month the calendar events are spread over, "YYYY-MM"
+    month: str = field(default_factory=lambda: datetime.utcnow().strftime("%Y-%m"))
+
+    def user_id(self, n: int) -> UUID:
+        return bench_id("user", n)
+
+    def event_id(self, n: int) -> UUID:
+        return bench_id("event", n)
+
+    @property
+    def host_id(self) -> UUID:
+        return self.user_id(0)
+
+    @property
+    def heavy_user_ids(self) -> list[UUID]:
+        return [self.user_id(n) for n in range(1, self.heavy_users + 1)]
+
+    @property
+    def rush_event_id(self) -> UUID:
+        return bench_id("event", "rush")
+
+    @property
+    def live_event_id(self) -> UUID:
+        return bench_id("event", "live")
+
+    @property
+    def summary_event_id(self) -> UUID:
+        return bench_id("event", "summary")
+
+    @property
+    def year_month(self) -> tuple[int, int]:
+        year, month = self.month.split("-")
+        return int(year), int(month)
+
+    def save(self, path: Path = DEFAULT_MANIFEST) -> None:
+        path.write_text(json.dumps(asdict(self), indent=2) + "\n")
+
+    @classmethod
+    def load(cls, path: Path = DEFAULT_MANIFEST) -> "Dataset":
+        if not path.exists():
+            raise SystemExit(f"No dataset manifest at {path}; run `python -m bench seed` first")
+        return cls(**json.loads(path.read_text()))
@@ -0,0 +1,91 @@
+# bench/load.py
+import asyncio
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Awaitable, Callable
+from uuid import UUID
+
+import httpx
+
+from app.main import app
+from app.users import cookie_transport, get_jwt_strategy
+
+
+@dataclass
+class Recorder:
+    """Latency and status of every request a scenario makes."""
+
+    latencies: list[float] = field(default_factory=list)
+    statuses: Counter = field(default_factory=Counter)
+    errors: Counter = field(default_factory=Counter)
+
+    async def request(self, client: httpx.AsyncClient, method: str, url: str, **kwargs) -> httpx.Response | None:
+        start = time.perf_counter()
+        try:
+            response = await client.request(method, url, **kwargs)
+        except Exception as exc:
+            self.errors[type(exc).__name__] += 1
+            return None
+        finally:
+            self.latencies.append(time.perf_counter() - start)
+        self.statuses[response.status_code] += 1
+        return response
+
+
+def percentile(ordered: list[float], q: float) -> float:
+    # Nearest-rank on an already sorted list
+    if not ordered:
+        return 0.0
+    return ordered[min(len(ordered) - 1, max(0, round(q * len(ordered)) - 1))]
+
+
+def report(name: str, recorder: Recorder, elapsed: float, **extra) -> dict:
+    ordered = sorted(recorder.latencies)
+    ms = lambda seconds: round(seconds * 1000, 3)
+    return {
+        "scenario": name,
+        "requests": len(ordered),
+        "elapsed_s": round(elapsed, 3),
+        "throughput_rps": round(len(ordered) / elapsed, 1) if elapsed else 0.0,
+        "latency_ms": {
+            "p50": ms(percentile(ordered, 0.50)),
+            "p95": ms(percentile(ordered, 0.95)),
+            "p99": ms(percentile(ordered, 0.99)),
+            "max": ms(ordered[-1]) if ordered else 0.0,
+            "mean": ms(sum(ordered) / len(ordered)) if ordered else 0.0,
+        },
+        "statuses": {str(status): count for status, count in sorted(recorder.statuses.items())},
+        "errors": dict(recorder.errors),
+        **extra,
+    }
+
+
+async def client_for(user_id: UUID) -> httpx.AsyncClient:
+    """In-process client authenticated as `user_id`, the same cookie a login would set."""
+    token = await get_jwt_strategy().write_token(_TokenSubject(user_id))
+    return httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app),
+        base_url="http://bench",
+        cookies={cookie_transport.cookie_name: token},
+        timeout=60,
+    )
+
+
+@dataclass(frozen=True)
+class _TokenSubject:
+    # JWTStrategy.write_token only reads `id`
+    id: UUID
+
+
+async def run_clients(workers: list[Callable[[], Awaitable[None]]], ramp_seconds: float = 0.0) -> float:
+    """Run all workers concurrently, starts spread over `ramp_seconds`. Returns elapsed seconds."""
+
+    async def staggered(index: int, worker: Callable[[], Awaitable[None]]) -> None:
+        if ramp_seconds:
+            await asyncio.sleep(ramp_seconds * index / len(workers))
+        await worker()
+
+    start = time.perf_counter()
+    await asyncio.gather(*(staggered(i, worker) for i, worker in enumerate(workers)))
+    return time.perf_counter() - start
@@ -0,0 +1,182 @@
+# bench/scenarios.py
+import asyncio
+import re
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Awaitable, Callable
+
+from sqlalchemy import delete, func, select
+
+from app.analytics import rollups
+from app.analytics.keywords import keyword_index
+from app.core.calendar_cache import calendar_cache
+from app.core.event_cache import event_cache
+from app.db.session import AsyncSessionLocal
+from app.models.rsvp import RSVP
+from bench.dataset import Dataset
+from bench.load import Recorder, client_for, report, run_clients
+
+CURSOR_PATTERN = re.compile(r"since=([0-9a-f-]+)")
+
+
+@dataclass
+class Options:
+    # None means the scenario's own default
+    clients: int | None = None
+    duration: float = 30.0
+    requests: int | None = None
+    ramp: float = 2.0
+    poll_interval: float = 1.0
+
+
+async def _close_all(clients) -> None:
+    await asyncio.gather(*(client.aclose() for client in clients))
+
+
+async def rsvp_rush(dataset: Dataset, options: Options) -> dict:
+    """Every client RSVPs to one capacity-limited event at the same instant; checks nobody overbooked."""
+    event_id = dataset.rush_event_id
+    async with AsyncSessionLocal() as db:
+        await db.execute(delete(RSVP).where(RSVP.event_id == event_id))
+        await db.commit()
+        await rollups.rebuild(db, event_id)
+    event_cache.invalidate(event_id)
+
+    count = min(options.clients or 2_000, dataset.users - 1)
+    clients = [await client_for(dataset.user_id(n)) for n in range(1, count + 1)]
+    recorder = Recorder()
+    gate = asyncio.Event()
+
+    def worker(client) -> Callable[[], Awaitable[None]]:
+        async def run() -> None:
+            await gate.wait()
+            await recorder.request(client, "POST", f"/events/{event_id}/rsvp")
+        return run
+
+    running = asyncio.create_task(run_clients([worker(client) for client in clients]))
+    # Let every client park on the gate, then release them together
+    await asyncio.sleep(0.1)
+    start = time.perf_counter()
+    gate.set()
+    await running
+    elapsed = time.perf_counter() - start
+    await _close_all(clients)
+
+    async with AsyncSessionLocal() as db:
+        rows = await db.scalar(select(func.count()).select_from(RSVP).where(RSVP.event_id == event_id))
+        distinct_users = await db.scalar(select(func.count(RSVP.user_id.distinct())).where(RSVP.event_id == event_id))
+        stats = await rollups.get_stats(db, event_id)
+    expected = min(count, dataset.rush_capacity)
+    checks = {
+        "capacity": dataset.rush_capacity,
+        "rsvp_rows": rows,
+        "distinct_users": distinct_users,
+        "counter": stats.rsvp_count if stats else None,
+        "confirmed_responses": recorder.statuses[200],
+        "ok": rows == distinct_users == expected == recorder.statuses[200] and stats is not None and stats.rsvp_count == expected,
+    }
+    return report("rsvp_rush", recorder, elapsed, clients=count, checks=checks)
+
+
+async def feedback_poll(dataset: Dataset, options: Options) -> dict:
+    """Many viewers of one live event: a snapshot each, then cursor polls until the duration is up."""
+    event_id = dataset.live_event_id
+    count = options.clients or 2_000
+    clients = [await client_for(dataset.user_id(1 + n % (dataset.users - 1))) for n in range(count)]
+    recorder = Recorder()
+    deadline = time.perf_counter() + options.ramp + options.duration
+    url = f"/events/{event_id}/feedback/stream"
+
+    def worker(client) -> Callable[[], Awaitable[None]]:
+        async def run() -> None:
+            since = None
+            while time.perf_counter() < deadline:
+                response = await recorder.request(client, "GET", url, params={"since": since} if since else None)
+                if response is not None and response.status_code == 200:
+                    cursors = CURSOR_PATTERN.findall(response.text)
+                    since = cursors[-1] if cursors else since
+                await asyncio.sleep(options.poll_interval)
+        return run
+
+    elapsed = await run_clients([worker(client) for client in clients], options.ramp)
+    await _close_all(clients)
+    return report("feedback_poll", recorder, elapsed, clients=count, poll_interval_s=options.poll_interval)
+
+
+async def feedback_storm(dataset: Dataset, options: Options) -> dict:
+    """Many attendees posting feedback to one live event as fast as they get answers."""
+    event_id = dataset.live_event_id
+    count = options.clients or 500
+    per_client = options.requests or 20
+    clients = [await client_for(dataset.user_id(1 + n % (dataset.users - 1))) for n in range(count)]
+    recorder = Recorder()
+
+    def worker(client, n: int) -> Callable[[], Awaitable[None]]:
+        async def run() -> None:
+            for i in range(per_client):
+                await recorder.request(client, "POST", f"/events/{event_id}/feedback", data={"emoji": "👍", "comment": f"storm {n} {i}"})
+        return run
+
+    elapsed = await run_clients([worker(client, n) for n, client in enumerate(clients)], options.ramp)
+    await _close_all(clients)
+    return report("feedback_storm", recorder, elapsed, clients=count, requests_per_client=per_client)
+
+
+async def summary_large(dataset: Dataset, options: Options) -> dict:
+    """Host opening the summary of an event with `summary_comments` comments: one cold, then concurrent warm."""
+    event_id = dataset.summary_event_id
+    count = options.clients or 10
+    total = options.requests or 200
+    keyword_index.discard(event_id)
+    host = await client_for(dataset.host_id)
+
+    cold = Recorder()
+    await cold.request(host, "GET", f"/events/{event_id}/summary")
+
+    recorder = Recorder()
+    remaining = iter(range(total))
+
+    async def run() -> None:
+        for _ in remaining:
+            await recorder.request(host, "GET", f"/events/{event_id}/summary")
+
+    elapsed = await run_clients([run for _ in range(count)])
+    await host.aclose()
+    return report(
+        "summary_large", recorder, elapsed,
+        clients=count, comments=dataset.summary_comments,
+        cold_ms=round(cold.latencies[0] * 1000, 3), cold_status=next(iter(cold.statuses), None),
+    )
+
+
+async def calendar_heavy(dataset: Dataset, options: Options) -> dict:
+    """Users with `rsvps_per_heavy_user` RSVPs in one month loading that month's calendar."""
+    year, month = dataset.year_month
+    # Start cold: the first load per user goes to the database, repeats measure the cache
+    calendar_cache.invalidate_month(datetime(year, month, 1))
+    clients = [await client_for(user_id) for user_id in dataset.heavy_user_ids]
+    per_client = options.requests or 50
+    recorder = Recorder()
+
+    def worker(client) -> Callable[[], Awaitable[None]]:
+        async def run() -> None:
+            for _ in range(per_client):
+                await recorder.request(client, "GET", "/calendar", params={"year": year, "month": month})
+        return run
+
+    elapsed = await run_clients([worker(client) for client in clients], options.ramp)
+    await _close_all(clients)
+    return report(
+        "calendar_heavy", recorder, elapsed,
+        clients=len(clients), rsvps_per_user=dataset.rsvps_per_heavy_user, calendar_cache=calendar_cache.stats(),
+    )
+
+
+SCENARIOS = {
+    "rsvp_rush": rsvp_rush,
+    "feedback_poll": feedback_poll,
+    "feedback_storm": feedback_storm,
+    "summary_large": summary_large,
+    "calendar_heavy": calendar_heavy,
+}
@@ -0,0 +1,116 @@
+# bench/seed.py
+import random
+import time
+import uuid
+from datetime import datetime, timedelta
+from typing import Iterator
+
+from fastapi_users.password import PasswordHelper
+from sqlalchemy import select, text
+
+from app.analytics import rollups
+from app.db.session import AsyncSessionLocal, engine
+from app.models.event import Event
+from bench.dataset import BENCH_EMAIL_DOMAIN, Dataset
+
+BENCH_PASSWORD = "bench-password"
+EMOJIS = ["👍", "👎", "❤️", "😮"]
+WORDS = (
+    "great talk slides demo audio loud quiet speaker question answer clear confusing fast slow "
+    "examples code microphone screen break coffee schedule venue wifi networking workshop keynote "
+    "panel live stream recording inspiring boring useful practical deep dive overview"
+).split()
+
+USER_COLUMNS = ["id", "email", "hashed_password", "is_active", "is_superuser", "is_verified", "username", "full_name"]
+EVENT_COLUMNS = ["id", "title", "description", "datetime", "location", "rsvp_deadline", "max_attendees", "status", "host_id", "updated_at"]
+RSVP_COLUMNS = ["id", "event_id", "user_id", "check_in_time"]
+FEEDBACK_COLUMNS = ["id", "event_id", "user_id", "emoji", "comment", "timestamp", "pinned", "flagged"]
+
+
+def _uuid(rng: random.Random) -> uuid.UUID:
+    return uuid.UUID(int=rng.getrandbits(128), version=4)
+
+
+def _users(dataset: Dataset) -> Iterator[tuple]:
+    hashed = PasswordHelper().hash(BENCH_PASSWORD)
+    for n in range(dataset.users):
+        yield (dataset.user_id(n), f"bench-{n}@{BENCH_EMAIL_DOMAIN}", hashed, True, False, True, f"bench-{n}", f"Bench User {n}")
+
+
+def _events(dataset: Dataset, now: datetime) -> Iterator[tuple]:
+    year, month = dataset.year_month
+    month_start = datetime(year, month, 1)
+    for n in range(dataset.events):
+        # Spread over the first 28 days so every event falls in the dataset month
+        when = month_start + timedelta(days=n % 28, hours=9 + n % 10)
+        yield (dataset.event_id(n), f"Bench event {n}", "Seeded for benchmarks", when, "Bench Hall",
+               when - timedelta(hours=1), 10_000, "Scheduled", dataset.host_id, now)
+    rush = now + timedelta(days=30)
+    yield (dataset.rush_event_id, "Bench RSVP rush", "Capacity-limited", rush, "Bench Hall",
+           rush - timedelta(days=1), dataset.rush_capacity, "Scheduled", dataset.host_id, now)
+    yield (dataset.live_event_id, "Bench live event", "Live feedback", now - timedelta(minutes=10), "Bench Hall",
+           now - timedelta(days=1), 10_000, "Live", dataset.host_id, now)
+    yield (dataset.summary_event_id, "Bench summary event", "Large summary", now - timedelta(hours=1), "Bench Hall",
+           now - timedelta(days=1), 10_000, "Live", dataset.host_id, now)
+
+
+def _rsvps(dataset: Dataset, rng: random.Random) -> Iterator[tuple]:
+    for user_id in dataset.heavy_user_ids:
+        for n in range(min(dataset.rsvps_per_heavy_user, dataset.events)):
+            yield (_uuid(rng), dataset.event_id(n), user_id, None)
+
+
+def _feedback(dataset: Dataset, rng: random.Random, now: datetime) -> Iterator[tuple]:
+    def row(event_id, when, comment):
+        user_id = dataset.user_id(rng.randrange(dataset.users))
+        return (_uuid(rng), event_id, user_id, rng.choice(EMOJIS), comment, when, False, False)
+
+    for _ in range(dataset.live_feedback):
+        yield row(dataset.live_event_id, now - timedelta(seconds=rng.uniform(0, 600)), "live " + rng.choice(WORDS))
+    for _ in range(dataset.summary_comments):
+        comment = " ".join(rng.choices(WORDS, k=rng.randint(3, 12)))
+        yield row(dataset.summary_event_id, now - timedelta(seconds=rng.uniform(0, 3600)), comment)
+    if dataset.events:
+        year, month = dataset.year_month
+        month_start = datetime(year, month, 1)
+        for _ in range(dataset.feedback_rows):
+            n = rng.randrange(dataset.events)
+            when = month_start + timedelta(days=n % 28, hours=9 + n % 10, seconds=rng.uniform(0, 3600))
+            yield row(dataset.event_id(n), when, rng.choice(WORDS) if rng.random() < 0.5 else None)
+
+
+async def _copy(table: str, columns: list[str], records: Iterator[tuple]) -> None:
+    start = time.perf_counter()
+    async with engine.connect() as conn:
+        raw = (await conn.get_raw_connection()).driver_connection
+        status = await raw.copy_records_to_table(table, records=records, columns=columns)
+    print(f"  {table}: {status} in {time.perf_counter() - start:.1f}s")
+
+
+async def reset() -> None:
+    """Remove everything seeded for benchmarks (events cascade to RSVPs, feedback and rollups)."""
+    bench_users = f"SELECT id FROM \"user\" WHERE email LIKE '%@{BENCH_EMAIL_DOMAIN}'"
+    async with AsyncSessionLocal() as db:
+        await db.execute(text(f"DELETE FROM events WHERE host_id IN ({bench_users})"))
+        await db.execute(text(f"DELETE FROM \"user\" WHERE id IN ({bench_users})"))
+        await db.commit()
+    print("Removed previous bench data")
+
+
+async def seed(dataset: Dataset) -> None:
+    rng = random.Random(dataset.seed)
+    now = datetime.utcnow()
+    await reset()
+    print("Seeding with COPY:")
+    await _copy("user", USER_COLUMNS, _users(dataset))
+    await _copy("events", EVENT_COLUMNS, _events(dataset, now))
+    await _copy("rsvps", RSVP_COLUMNS, _rsvps(dataset, rng))
+    await _copy("feedback", FEEDBACK_COLUMNS, _feedback(dataset, rng, now))
+
+    start = time.perf_counter()
+    async with AsyncSessionLocal() as db:
+        event_ids = (await db.execute(select(Event.id).where(Event.host_id == dataset.host_id))).scalars().all()
+        for event_id in event_ids:
+            await rollups.rebuild(db, event_id)
+        await db.execute(text("ANALYZE"))
+    print(f"  rollups for {len(event_ids)} events in {time.perf_counter() - start:.1f}s")
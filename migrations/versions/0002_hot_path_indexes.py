@@ -0,0 +1,51 @@
+"""hot path indexes and unique rsvp per user
+
+user.email is already covered by the unique ix_user_email index from 0001.
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-18 00:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0002"
+down_revision: Union[str, Sequence[str], None] = "0001"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # The RSVP check-then-insert could race; keep one row per (event, user),
+    # preferring the one that is checked in, before adding the constraint.
+    op.execute(
+        """
+        DELETE FROM rsvps
+        WHERE id IN (
+            SELECT id FROM (
+                SELECT id, row_number() OVER (
+                    PARTITION BY event_id, user_id
+                    ORDER BY check_in_time IS NULL, check_in_time, id
+                ) AS rn
+                FROM rsvps
+            ) ranked
+            WHERE ranked.rn > 1
+        )
+        """
+    )
+    op.create_unique_constraint("uq_rsvps_event_id_user_id", "rsvps", ["event_id", "user_id"])
+    op.create_index("ix_rsvps_user_id", "rsvps", ["user_id"])
+    op.create_index("ix_feedback_event_id_timestamp", "feedback", ["event_id", "timestamp", "id"])
+    op.create_index("ix_events_host_id_datetime", "events", ["host_id", "datetime"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_events_host_id_datetime", table_name="events")
+    op.drop_index("ix_feedback_event_id_timestamp", table_name="feedback")
+    op.drop_index("ix_rsvps_user_id", table_name="rsvps")
+    op.drop_constraint("uq_rsvps_event_id_user_id", "rsvps", type_="unique")
@@ -0,0 +1,78 @@
+"""per-event analytics rollups
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-18 00:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0003"
+down_revision: Union[str, Sequence[str], None] = "0002"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "event_stats",
+        sa.Column("event_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("rsvp_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("checkin_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("feedback_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.ForeignKeyConstraint(["event_id"], ["events.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("event_id"),
+    )
+    op.create_table(
+        "event_emoji_counts",
+        sa.Column("event_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("emoji", sa.String(), nullable=False),
+        sa.Column("count", sa.Integer(), nullable=False, server_default="0"),
+        sa.ForeignKeyConstraint(["event_id"], ["events.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("event_id", "emoji"),
+    )
+    op.create_table(
+        "event_feedback_minutes",
+        sa.Column("event_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("minute", sa.DateTime(), nullable=False),
+        sa.Column("count", sa.Integer(), nullable=False, server_default="0"),
+        sa.ForeignKeyConstraint(["event_id"], ["events.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("event_id", "minute"),
+    )
+
+    # Backfill from the raw tables
+    op.execute(
+        """
+        INSERT INTO event_stats (event_id, rsvp_count, checkin_count, feedback_count)
+        SELECT e.id,
+               (SELECT count(*) FROM rsvps r WHERE r.event_id = e.id),
+               (SELECT count(*) FROM rsvps r WHERE r.event_id = e.id AND r.check_in_time IS NOT NULL),
+               (SELECT count(*) FROM feedback f WHERE f.event_id = e.id)
+        FROM events e
+        """
+    )
+    op.execute(
+        """
+        INSERT INTO event_emoji_counts (event_id, emoji, count)
+        SELECT event_id, emoji, count(*) FROM feedback GROUP BY event_id, emoji
+        """
+    )
+    op.execute(
+        """
+        INSERT INTO event_feedback_minutes (event_id, minute, count)
+        SELECT event_id, date_trunc('minute', timestamp), count(*) FROM feedback
+        GROUP BY event_id, date_trunc('minute', timestamp)
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("event_feedback_minutes")
+    op.drop_table("event_emoji_counts")
+    op.drop_table("event_stats")
@@ -0,0 +1,32 @@
+"""keyset pagination indexes for a host's events
+
+(host_id, datetime, id) replaces (host_id, datetime), which it covers.
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-18 00:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0004"
+down_revision: Union[str, Sequence[str], None] = "0003"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index("ix_events_host_id_datetime_id", "events", ["host_id", "datetime", "id"])
+    op.create_index("ix_events_host_id_status_datetime_id", "events", ["host_id", "status", "datetime", "id"])
+    op.drop_index("ix_events_host_id_datetime", table_name="events")
+
+
+def downgrade() -> None:
+    op.create_index("ix_events_host_id_datetime", "events", ["host_id", "datetime"])
+    op.drop_index("ix_events_host_id_status_datetime_id", table_name="events")
+    op.drop_index("ix_events_host_id_datetime_id", table_name="events")
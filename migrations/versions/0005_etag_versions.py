@@ -0,0 +1,35 @@
+"""cheap versions for conditional GETs
+
+events.updated_at versions an event's own fields; event_stats.moderation_count,
+with feedback_count, versions its feedback stream.
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-18 00:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0005"
+down_revision: Union[str, Sequence[str], None] = "0004"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "events",
+        sa.Column("updated_at", sa.DateTime(), nullable=False, server_default=sa.text("(now() at time zone 'utc')")),
+    )
+    op.alter_column("events", "updated_at", server_default=None)
+    op.add_column("event_stats", sa.Column("moderation_count", sa.Integer(), nullable=False, server_default="0"))
+
+
+def downgrade() -> None:
+    op.drop_column("event_stats", "moderation_count")
+    op.drop_column("events", "updated_at")
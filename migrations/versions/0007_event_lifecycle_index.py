@@ -0,0 +1,26 @@
+"""index for the event lifecycle sweeps
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2026-10-18 00:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0007"
+down_revision: Union[str, Sequence[str], None] = "0006"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index("ix_events_status_datetime", "events", ["status", "datetime"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_events_status_datetime", table_name="events")
@@ -0,0 +1,86 @@
+# tests/test_rsvp_concurrency.py
+# Races many RSVPs against one event on a real Postgres database. Point TEST_DATABASE_URL at a
+# scratch database migrated with `alembic upgrade head`; the test cleans up what it creates.
+import asyncio
+import os
+import uuid
+from datetime import datetime, timedelta
+
+import pytest
+
+TEST_DATABASE_URL = os.environ.get("TEST_DATABASE_URL")
+if not TEST_DATABASE_URL:
+    pytest.skip("TEST_DATABASE_URL is not set", allow_module_level=True)
+
+os.environ.setdefault("DATABASE_URL", TEST_DATABASE_URL)
+os.environ.setdefault("SECRET", "test")
+
+from sqlalchemy import delete, func, insert, select  # noqa: E402
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine  # noqa: E402
+from sqlalchemy.orm import sessionmaker  # noqa: E402
+
+from app.analytics import rollups  # noqa: E402
+from app.db.session import async_url  # noqa: E402
+from app.models.event import Event  # noqa: E402
+from app.models.event_stats import EventStats  # noqa: E402
+from app.models.rsvp import RSVP  # noqa: E402
+from app.models.user import User  # noqa: E402
+
+USERS = 300
+
+
+async def _race(max_attendees: int) -> None:
+    engine = create_async_engine(async_url(TEST_DATABASE_URL), pool_size=40, max_overflow=0, pool_timeout=60)
+    Session = sessionmaker(engine, expire_on_commit=False, class_=AsyncSession)
+    user_ids = [uuid.uuid4() for _ in range(USERS)]
+    event_id = uuid.uuid4()
+    try:
+        async with Session() as db:
+            await db.execute(insert(User), [
+                {"id": user_id, "email": f"{user_id.hex}@example.com", "hashed_password": "x", "username": user_id.hex,
+                 "is_active": True, "is_superuser": False, "is_verified": True}
+                for user_id in user_ids
+            ])
+            db.add(Event(
+                id=event_id, title="RSVP race", description="", location="", host_id=user_ids[0],
+                datetime=datetime.utcnow() + timedelta(days=2), rsvp_deadline=datetime.utcnow() + timedelta(days=1),
+                max_attendees=max_attendees,
+            ))
+            await db.commit()
+            await rollups.ensure_stats(db, event_id)
+            await db.commit()
+
+        gate = asyncio.Event()
+
+        async def rsvp(user_id: uuid.UUID) -> str:
+            await gate.wait()
+            async with Session() as db:
+                return await rollups.reserve_rsvp(db, event_id, user_id)
+
+        # Every user twice, so duplicates race against each other as well as against the cap
+        tasks = [asyncio.create_task(rsvp(user_id)) for user_id in user_ids * 2]
+        await asyncio.sleep(0.1)
+        gate.set()
+        outcomes = await asyncio.gather(*tasks)
+
+        expected = min(USERS, max_attendees)
+        async with Session() as db:
+            rows, users = (await db.execute(
+                select(func.count(), func.count(RSVP.user_id.distinct())).where(RSVP.event_id == event_id)
+            )).one()
+            rsvp_count = await db.scalar(select(EventStats.rsvp_count).where(EventStats.event_id == event_id))
+
+        assert outcomes.count("confirmed") == expected
+        assert rows == users == rsvp_count == expected
+        assert set(outcomes) <= {"confirmed", "duplicate", "full"}
+    finally:
+        async with Session() as db:
+            await db.execute(delete(Event).where(Event.id == event_id))
+            await db.execute(delete(User).where(User.id.in_(user_ids)))
+            await db.commit()
+        await engine.dispose()
+
+
+@pytest.mark.parametrize("max_attendees", [50, USERS - 1, USERS, USERS + 1])
+def test_concurrent_rsvps_respect_capacity(max_attendees):
+    asyncio.run(_race(max_attendees))